@@ -0,0 +1,189 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# First matching topic wins, so more specific topics come first
+QUESTION_TOPICS = [
+    ("Dynamic Programming", r"\bdp\b|dynamic programming|knapsack|subsequence|coin change|memoi"),
+    ("Linked List", r"linked ?list"),
+    ("Trees", r"\btrees?\b|\bbst\b|\blca\b|inorder|preorder|postorder|\btrie\b"),
+    ("Graphs", r"graph|\bbfs\b|\bdfs\b|dijkstra|topological|islands?\b|shortest path"),
+    ("Binary Search", r"binary search|rotated sorted"),
+    ("Heap", r"\bheap\b|priority queue|\bkth\b|top k"),
+    ("Stack & Queue", r"\bstack\b|\bqueue\b|parenthes"),
+    ("Strings", r"string|substring|palindrom|anagram"),
+    ("Hashing", r"hash|\blru\b|\blfu\b|cache"),
+    ("Arrays", r"array|subarray|\bsum\b|matrix|interval|sort"),
+    ("System Design", r"\bdesign\b|architecture|scalab"),
+    ("CS Fundamentals", r"\boops?\b|\bdbms\b|\bsql\b|operating system|\bos\b|network"),
+]
+OTHER_TOPIC = "Other"
+
+DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(hours?|hrs?|h|minutes?|mins?|m)\b", re.IGNORECASE)
+DURATION_BUCKETS = [0, 30, 60, 90, np.inf]
+DURATION_LABELS = ["up to 30 min", "31-60 min", "61-90 min", "over 90 min"]
+
+
+def question_topics(text: pd.Series) -> pd.Series:
+    """Topic label per question text, one vectorized regex scan per topic"""
+    text = text.fillna("").str.lower()
+    conditions = [text.str.contains(pattern, regex=True) for _, pattern in QUESTION_TOPICS]
+    labels = [topic for topic, _ in QUESTION_TOPICS]
+    return pd.Series(np.select(conditions, labels, default=OTHER_TOPIC), index=text.index)
+
+
+def duration_minutes(value):
+    if not value:
+        return np.nan
+    m = DURATION_RE.search(value)
+    if not m:
+        return np.nan
+    amount = float(m.group(1))
+    return amount * 60 if m.group(2).lower().startswith("h") else amount
+
+
+class CorpusAnalytics:
+    """
+    Aggregates over the loaded Interview records, computed once when the
+    corpus is loaded: per-round topic and difficulty distributions, rounds per
+    interview, and mode/duration histograms.
+    """
+
+    def __init__(self, records):
+        interviews, rounds, questions = [], [], []
+        for i, record in enumerate(records):
+            interviews.append((i, len(record.rounds), list(record.topics or ())))
+            for r in record.rounds:
+                rounds.append((i, r.round_number, r.mode, r.duration, len(r.questions)))
+                for q in r.questions:
+                    questions.append((i, r.round_number, q.title, q.difficulty, q.approach))
+
+        self.interviews = pd.DataFrame(interviews, columns=["interview", "n_rounds", "topics"])
+        self.rounds = pd.DataFrame(rounds, columns=["interview", "round_number", "mode", "duration", "n_questions"])
+        self.questions = pd.DataFrame(questions, columns=["interview", "round_number", "title", "difficulty", "approach"])
+
+        self.questions["topic"] = question_topics(self.questions["title"] + " " + self.questions["approach"])
+        self.rounds["mode"] = self.rounds["mode"].fillna("Unknown").str.strip().str.title()
+        minutes = self.rounds["duration"].map(duration_minutes)
+        self.rounds["duration_bucket"] = pd.cut(minutes, DURATION_BUCKETS, labels=DURATION_LABELS)
+
+        self.topic_by_round = pd.crosstab(self.questions["round_number"], self.questions["topic"])
+        self.difficulty_by_round = pd.crosstab(
+            self.questions["round_number"], self.questions["difficulty"].fillna("Unrated"))
+        self.round_counts = self.interviews["n_rounds"].value_counts().sort_index()
+        self.mode_histogram = self.rounds["mode"].value_counts()
+        self.duration_histogram = self.rounds["duration_bucket"].value_counts().reindex(DURATION_LABELS, fill_value=0)
+        self.declared_topics = self.interviews["topics"].explode().dropna().str.strip().value_counts()
+
+    @property
+    def size(self):
+        return len(self.interviews)
+
+    def topic_distribution(self, round_number=None):
+        return self._distribution(self.topic_by_round, round_number)
+
+    def difficulty_distribution(self, round_number=None):
+        return self._distribution(self.difficulty_by_round, round_number)
+
+    @staticmethod
+    def _distribution(table, round_number):
+        """Counts per column, for one round or all rounds, most common first"""
+        if round_number is not None:
+            if round_number not in table.index:
+                return pd.Series(dtype="int64")
+            counts = table.loc[round_number]
+        else:
+            counts = table.sum(axis=0)
+        return counts[counts > 0].sort_values(ascending=False)
+
+
+def format_distribution(counts, heading, unit="questions"):
+    """Markdown list of 'label: count (pct%)' lines under a heading"""
+    total = int(counts.sum())
+    lines = [f"**{heading}** ({total} {unit})", ""]
+    for label, count in counts.items():
+        lines.append(f"- {label}: {int(count)} ({count / total:.1%})")
+    return "\n".join(lines)
+
+
+# Statistical cues; an intent only matches when one appears with its subject
+STAT_CUE = (r"(?:distribution|percentage|percent|breakdown|how many|number of|count|histogram|statistics"
+            r"|stats|frequency|average)")
+ROUND_RE = re.compile(r"\bround\s*(\d+)\b", re.IGNORECASE)
+
+
+def _cue_with(subject):
+    """Pattern for a statistical cue and `subject` in either order"""
+    return re.compile(rf"\b{STAT_CUE}\b.*\b(?:{subject})\b|\b(?:{subject})\b.*\b{STAT_CUE}\b", re.IGNORECASE)
+
+
+INTENTS = [
+    ("questions", re.compile(r"\b(most (?:asked|common|frequent)|frequently asked|top \d*\s*)\b.*\b(questions?|problems?)\b",
+                             re.IGNORECASE)),
+    ("topic", _cue_with(r"topics?|topic[- ]wise")),
+    ("difficulty", _cue_with(r"difficult(?:y|ies)|easy|medium|moderate|hard")),
+    ("mode", _cue_with(r"modes?|online|offline|in[- ]person|virtual")),
+    ("duration", re.compile(rf"\bhow long (?:is|are|was|were|does|do|did) (?:each |every |the |a |an )?"
+                            rf"(?:rounds?|interviews?)\b|{_cue_with(r'durations?|length').pattern}", re.IGNORECASE)),
+    ("rounds", _cue_with(r"rounds")),
+]
+
+
+def route_query(prompt, analytics, catalog=None):
+    """
+    Answer statistical prompts straight from the precomputed tables. A prompt
+    is statistical when a cue ('distribution', 'how many', ...) appears with
+    an intent's subject ('topics', 'mode', ...). Returns None otherwise (or
+    when the corpus has no data for it) so the caller falls back to the LLM.
+    """
+    if analytics is None:
+        return None
+    round_match = ROUND_RE.search(prompt)
+    round_number = int(round_match.group(1)) if round_match else None
+    where = f" in round {round_number}" if round_number is not None else ""
+    base = f"_Computed from {analytics.size} interview experiences._"
+
+    for intent, pattern in INTENTS:
+        if not pattern.search(prompt):
+            continue
+        if intent == "questions":
+            if catalog is None:
+                continue
+            top = catalog.most_asked(round_number=round_number)
+            if not top:
+                return None
+            lines = [f"**Most asked questions{where}**", ""]
+            lines += [f"{n}. {title} (asked {count}x)" for n, (_, title, count) in enumerate(top, 1)]
+            return "\n".join(lines + ["", base])
+        if intent == "topic":
+            counts = analytics.topic_distribution(round_number)
+            if counts.empty:
+                counts = analytics.declared_topics if round_number is None else counts
+                if counts.empty:
+                    return None
+                return format_distribution(counts, "Topics listed by candidates", unit="mentions") + "\n\n" + base
+            return format_distribution(counts, f"Topic-wise distribution of questions{where}") + "\n\n" + base
+        if intent == "difficulty":
+            counts = analytics.difficulty_distribution(round_number)
+            if counts.empty:
+                return None
+            return format_distribution(counts, f"Difficulty distribution{where}") + "\n\n" + base
+        if intent == "mode":
+            if analytics.mode_histogram.empty:
+                return None
+            return format_distribution(analytics.mode_histogram, "Interview mode", unit="rounds") + "\n\n" + base
+        if intent == "duration":
+            counts = analytics.duration_histogram[analytics.duration_histogram > 0]
+            if counts.empty:
+                return None
+            return format_distribution(counts, "Round duration", unit="rounds with a duration") + "\n\n" + base
+        if intent == "rounds":
+            counts = analytics.round_counts
+            if counts.empty:
+                return None
+            counts = counts.rename(lambda n: f"{n} round{'s' if n != 1 else ''}")
+            average = analytics.interviews["n_rounds"].mean()
+            return (format_distribution(counts, "Number of rounds per interview", unit="interviews")
+                    + f"\n\nAverage: {average:.1f} rounds\n\n" + base)
+    return None
@@ -0,0 +1,92 @@
+"""
+Micro-benchmark: round-level link lookup in json_to_documents.
+
+Compares the old per-round `raw.split("### Round N")` scan against the
+precomputed round-segment index on long synthetic transcripts.
+
+    python benchmarks/bench_round_links.py --rounds 200 --interviews 50
+"""
+import os
+import re
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_preprocessor import iter_structured, json_to_documents, round_links  # noqa: E402
+
+
+def synthetic_transcript(rounds, seed=0):
+    parts = ["## Interview Preparation Journey\nPreparation\nDuration: 3 months\nTopics: Arrays, DP, Graphs\n"]
+    parts.append("\n\n## Interview Rounds")
+    for n in range(1, rounds + 1):
+        parts.append(
+            f"\n\n### Round {n}\nMode: Online\nDuration: 60 minutes\n"
+            f"1. Problem {seed}-{n}\nModerate\nProblem approach\nUse a hash map, see "
+            f"https://example.com/{seed}/{n}/a and https://example.com/{seed}/{n}/b.\n"
+            + "Discussion of trade-offs and follow ups. " * 20
+        )
+    return "".join(parts)
+
+
+def legacy_links(entry, rnum):
+    raw_text = entry.get("raw", "")
+    round_number_str = f"### Round {rnum}"
+    if round_number_str in raw_text:
+        round_text = raw_text.split(round_number_str, 1)[1].split("### Round", 1)[0]
+        return re.findall(r"https?://[^\s,\)]+", round_text)
+    return []
+
+
+def build_records(interviews, rounds):
+    records = []
+    for seed in range(interviews):
+        raw = synthetic_transcript(rounds, seed)
+        for entry in iter_structured(raw):
+            entry["raw"] = raw
+            records.append(entry)
+    return records
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    records = build_records(args.interviews, args.rounds)
+
+    legacy, legacy_secs = timed(lambda: [
+        [legacy_links(entry, r["round_number"]) for r in entry["interview_rounds"]] for entry in records
+    ])
+
+    def indexed():
+        out = []
+        for entry in records:
+            links = round_links(entry["raw"])
+            out.append([links.get(r["round_number"], []) for r in entry["interview_rounds"]])
+        return out
+
+    index, index_secs = timed(indexed)
+    assert legacy == index, "round-segment index disagrees with the legacy scan"
+
+    for entry, per_round in zip(records, index):
+        for r, links in zip(entry["interview_rounds"], per_round):
+            r["links"] = links
+    _, render_secs = timed(lambda: json_to_documents(records))
+
+    print(f"{args.interviews} interviews x {args.rounds} rounds")
+    print(f"legacy per-round split : {legacy_secs:8.3f}s")
+    print(f"segment index          : {index_secs:8.3f}s  ({legacy_secs / max(index_secs, 1e-9):.1f}x)")
+    print(f"json_to_documents      : {render_secs:8.3f}s  (links precomputed)")
+
+
+if __name__ == "__main__":
+    main()
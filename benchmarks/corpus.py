@@ -0,0 +1,144 @@
+"""
+Deterministic synthetic corpus for the benchmarks.
+
+Code360-style descriptions follow the layout the scrapers produce
+(render_description) and that clean_and_structure parses; GFG-style pages
+mimic the article markup parse_full_text walks. The same seed always gives
+the same corpus.
+
+    python benchmarks/corpus.py --write-fixtures
+"""
+import os
+import sys
+import random
+import argparse
+from html import escape
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from experience_parser import JOURNEY_ID, ROUND_CONTAINER_BASE_ID, render_description  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+COMPANIES = ["Microsoft", "Google", "Amazon", "Adobe", "Flipkart", "Atlassian", "Uber", "Oracle"]
+ROLES = ["SDE-1", "SDE-2", "SDE Intern"]
+TOPICS = ["Arrays", "Strings", "Dynamic Programming", "Graphs", "Trees", "Linked List", "OOPS", "DBMS",
+          "Operating Systems", "System Design", "Heap", "Binary Search"]
+PROBLEMS = ["Two Sum", "LRU Cache", "Merge K Sorted Lists", "Trapping Rain Water", "Number of Islands",
+            "Longest Common Subsequence", "Kth Largest Element", "Valid Parentheses", "Rotate Matrix",
+            "Design a URL Shortener", "Course Schedule", "Serialize and Deserialize Binary Tree",
+            "Median of Two Sorted Arrays", "Coin Change", "Word Break", "Reverse Linked List in Groups"]
+DIFFICULTIES = ["Easy", "Moderate", "Hard"]
+ROUND_TYPES = ["Online Coding Test", "Technical Interview", "Hiring Manager Round", "HR Round"]
+MODES = ["Online", "Offline", "Video Call"]
+DURATIONS = ["45 minutes", "60 minutes", "90 minutes", "1 hour", "2 hours"]
+FILLER = ("The interviewer was friendly and asked me to walk through my projects before moving on. "
+          "I explained the brute force first, then optimised it while discussing complexity. ")
+
+
+def _approach(rng):
+    return "\n".join(f"{FILLER * rng.randint(1, 3)}Step {step}." for step in range(1, rng.randint(2, 4)))
+
+
+def _round_text(rng, number):
+    lines = [f"Round {number}: {rng.choice(ROUND_TYPES)}", f"Duration: {rng.choice(DURATIONS)}",
+             f"Mode: {rng.choice(MODES)}", FILLER * rng.randint(1, 4)]
+    for q in range(1, rng.randint(1, 4) + 1):
+        title = rng.choice(PROBLEMS)
+        lines.append(f"{q}. {title}\n{rng.choice(DIFFICULTIES)}")
+        lines.append(f"Problem approach\n{_approach(rng)}")
+        if rng.random() < 0.3:
+            lines.append(f"Try solving now https://www.naukri.com/code360/problems/{title.lower().replace(' ', '-')}")
+        if rng.random() < 0.3:
+            lines.append("Solve later")
+    return "\n".join(lines)
+
+
+def generate_interview(rng):
+    """(journey, rounds) for one Code360 experience"""
+    journey = "\n".join([
+        "Application process\nWhere: " + rng.choice(["Campus", "Referral", "LinkedIn", "Company website"]),
+        "Eligibility: " + rng.choice(["Above 7 CGPA", "No criteria", "B.Tech only"]),
+        "Preparation\nDuration: " + rng.choice(["2 months", "6 months", "1 year"]),
+        "Topics: " + ", ".join(rng.sample(TOPICS, rng.randint(2, 6))),
+        "\n".join(f"Tip {n}: {FILLER.split('.')[n % 2].strip()}" for n in range(1, rng.randint(2, 4))),
+        "Resume tip\nTip 1: Keep it to one page and quantify impact.",
+        FILLER * rng.randint(1, 5),
+    ])
+    rounds = [_round_text(rng, n) for n in range(1, rng.randint(1, 5) + 1)]
+    return journey, rounds
+
+
+def generate_rows(n, seed=0):
+    """`n` scraped Code360 rows (company, role, url, title, description)"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        journey, rounds = generate_interview(rng)
+        company = rng.choice(COMPANIES)
+        rows.append({
+            "company": company,
+            "role": rng.choice(ROLES),
+            "url": f"https://www.naukri.com/code360/interview-experiences/{company.lower()}/{i}",
+            "title": f"{company} interview experience {i}",
+            "description": render_description(journey, rounds),
+        })
+    return rows
+
+
+def code360_html(rng):
+    journey, rounds = generate_interview(rng)
+    body = [f'<h1>{escape(rng.choice(COMPANIES))} interview experience</h1>',
+            f'<span class="round-badge">{escape(rng.choice(ROLES))}</span>',
+            f'<div id="{JOURNEY_ID}">' + "".join(f"<p>{escape(line)}</p>" for line in journey.split("\n")) + "</div>"]
+    for n, text in enumerate(rounds, 1):
+        body.append(f'<div id="{ROUND_CONTAINER_BASE_ID}{n}">'
+                    + "".join(f"<p>{escape(line)}</p>" for line in text.split("\n")) + "</div>")
+    return "<html><head><script>var x = 1;</script></head><body>" + "".join(body) + "</body></html>"
+
+
+def gfg_html(rng):
+    parts = [f"<p>{escape(FILLER)}</p>"]
+    for n in range(1, rng.randint(2, 5) + 1):
+        parts.append(f"<p><strong>Round {n}: {escape(rng.choice(ROUND_TYPES))}</strong></p>")
+        for q in range(rng.randint(1, 3)):
+            parts.append(f"<p>{escape(rng.choice(PROBLEMS))}. {escape(FILLER * rng.randint(1, 3))}</p>")
+        parts.append(f"<ul><li>{escape(rng.choice(TOPICS))}</li><li>{escape(rng.choice(TOPICS))}</li></ul>")
+    return ('<html><body><header>GeeksforGeeks</header><article><div class="text">'
+            + "".join(parts) + "</div></article><footer>footer</footer></body></html>")
+
+
+def generate_html(n, kind, seed=0):
+    rng = random.Random(seed)
+    make = code360_html if kind == "code360" else gfg_html
+    return [make(rng) for _ in range(n)]
+
+
+def load_fixtures(kind):
+    """Saved HTML fixtures of one kind ('code360' or 'gfg')"""
+    pages = []
+    for name in sorted(os.listdir(FIXTURES_DIR)):
+        if name.startswith(kind) and name.endswith(".html"):
+            with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+                pages.append(f.read())
+    return pages
+
+
+def write_fixtures(count=3, seed=0):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for kind in ("code360", "gfg"):
+        for i, page in enumerate(generate_html(count, kind, seed), 1):
+            with open(os.path.join(FIXTURES_DIR, f"{kind}_{i}.html"), "w", encoding="utf-8") as f:
+                f.write(page)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--write-fixtures", action="store_true", help="regenerate benchmarks/fixtures/*.html")
+    parser.add_argument("--sample", type=int, default=0, help="print N generated descriptions")
+    args = parser.parse_args()
+    if args.write_fixtures:
+        write_fixtures()
+    for row in generate_rows(args.sample):
+        print(row["description"], end="\n\n" + "-" * 60 + "\n\n")
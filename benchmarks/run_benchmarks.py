@@ -0,0 +1,161 @@
+"""
+Parser and post-processing benchmark suite.
+
+Runs each pipeline stage over a deterministic synthetic corpus (see
+corpus.py) and reports throughput, peak traced memory and the number of
+allocated blocks still held by the stage's output. Results can be saved as a
+baseline; later runs fail (exit 1) when a stage gets slower or hungrier than
+the baseline by more than --tolerance.
+
+    python benchmarks/run_benchmarks.py --sizes 10,1000,10000
+    python benchmarks/run_benchmarks.py --sizes 1000 --update-baseline
+    python benchmarks/run_benchmarks.py --sizes 1000 --tolerance 0.15
+"""
+import os
+import gc
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import pandas as pd  # noqa: E402
+
+from corpus import generate_html, generate_rows, load_fixtures  # noqa: E402
+from data_preprocessor import iter_structured_rows, json_to_documents  # noqa: E402
+from experience_parser import parse_experience_html  # noqa: E402
+from interview_records import to_records  # noqa: E402
+from scrapper import clean_experience_text, parse_full_text  # noqa: E402
+
+DEFAULT_SIZES = "10,1000,10000"
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_TOLERANCE = 0.25   # allowed fractional slowdown / memory growth before failing
+HTML_LIMIT = 1000          # HTML stages parse at most this many pages per size
+MIN_SECONDS = 0.005        # timings this short are too noisy to flag
+
+
+def build_stages(size, seed, html_limit):
+    """[(name, items, input_bytes, fn)] for one corpus size; inputs are built up front"""
+    df = pd.DataFrame(generate_rows(size, seed))
+    structured = list(iter_structured_rows(df))
+    pages = size if html_limit is None else min(size, html_limit)
+    code360_pages = load_fixtures("code360") + generate_html(pages, "code360", seed)
+    gfg_pages = load_fixtures("gfg") + generate_html(pages, "gfg", seed)
+    text_bytes = int(df["description"].str.len().sum())
+
+    return [
+        ("structure", len(df), text_bytes, lambda: list(iter_structured_rows(df))),
+        ("documents", len(structured), text_bytes, lambda: json_to_documents(structured)),
+        ("records", len(structured), text_bytes, lambda: to_records(structured)),
+        ("code360_html", len(code360_pages), sum(map(len, code360_pages)),
+         lambda: [parse_experience_html(page) for page in code360_pages]),
+        ("gfg_html", len(gfg_pages), sum(map(len, gfg_pages)),
+         lambda: [clean_experience_text(parse_full_text(page)) for page in gfg_pages]),
+    ]
+
+
+def measure(fn, repeat):
+    """Best wall time over `repeat` untraced runs, then one traced run for memory"""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    del result
+    return best, peak, blocks
+
+
+def run(sizes, seed, repeat, html_limit):
+    results = {}
+    for size in sizes:
+        for name, items, input_bytes, fn in build_stages(size, seed, html_limit):
+            seconds, peak, blocks = measure(fn, repeat)
+            results[f"{name}@{size}"] = {
+                "items": items,
+                "seconds": round(seconds, 6),
+                "items_per_sec": round(items / seconds, 1) if seconds else None,
+                "mb_per_sec": round(input_bytes / seconds / 1e6, 2) if seconds else None,
+                "peak_mb": round(peak / 1e6, 3),
+                "live_blocks": blocks,
+            }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Regression messages for stages slower or larger than baseline * (1 + tolerance)"""
+    failures = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        for metric in ("seconds", "peak_mb", "live_blocks"):
+            before, now = previous.get(metric), current.get(metric)
+            if metric == "seconds" and max(before or 0, now) < MIN_SECONDS:
+                continue
+            if before and now > before * (1 + tolerance):
+                failures.append(f"{key} {metric}: {before} -> {now} (+{now / before - 1:.0%})")
+    return failures
+
+
+def print_table(results):
+    header = f"{'stage':<22}{'items':>8}{'sec':>10}{'items/s':>12}{'MB/s':>8}{'peak MB':>10}{'blocks':>10}"
+    print(header)
+    print("-" * len(header))
+    for key, r in results.items():
+        print(f"{key:<22}{r['items']:>8}{r['seconds']:>10.4f}{r['items_per_sec']:>12.1f}"
+              f"{r['mb_per_sec']:>8.2f}{r['peak_mb']:>10.2f}{r['live_blocks']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated interview counts (10 to 100000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage; the best is kept")
+    parser.add_argument("--html-limit", type=int, default=HTML_LIMIT, help="max HTML pages per size (0 = no cap)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true", help="save this run as the new baseline")
+    parser.add_argument("--output", help="also write the results as JSON here")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results = run(sizes, args.seed, args.repeat, args.html_limit or None)
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\nNo baseline yet; run with --update-baseline to record one.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        failures = compare(results, json.load(f), args.tolerance)
+    if failures:
+        print(f"\nRegressions beyond {args.tolerance:.0%}:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print(f"\nNo regressions beyond {args.tolerance:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,11 +8,16 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import streamlit as st
+from driver_pool import DriverPool
+from experience_parser import extract_with_driver, fetch_experience
+from scrape_cache import get_scrape_cache
+from watermarks import get_watermark_store, is_known
+from telemetry import ScrapeTelemetry, get_telemetry
+from page_waits import DEFAULT_PAGE_DEADLINE, PageBudget, document_ready, replaced
 
 # Streamlit Cloud environment setup
 os.environ["STREAMLIT_DISABLE_WATCHDOG_WARNINGS"] = "true"
@@ -22,6 +27,13 @@ os.environ["STREAMLIT_WATCH_MODE"] = "poll"
 CHROMEDRIVER_PATH = "/tmp/chromedriver"
 CHROME_BINARY_PATH = "/usr/bin/google-chrome"
 
+# Recycle a pooled driver after this many pages to keep Chrome's memory in check
+DRIVER_MAX_USES = 25
+
+EXPERIENCE_LINK_LOCATOR = (By.XPATH, '//a[contains(@href, "/experiences/")]')
+# Cap for waiting on the link list to re-render after clicking "Next"
+LINK_RERENDER_TIMEOUT = 5
+
 @st.cache_resource
 def setup_chrome_for_streamlit():
     """
@@ -160,14 +172,19 @@ def get_chrome_driver():
         st.error(f"❌ Failed to create Chrome driver: {e}")
         raise e
 
-def test_driver():
+def test_driver(pool=None):
     """Test if the driver works correctly"""
     try:
         with st.spinner("🧪 Testing Chrome driver..."):
-            driver = get_chrome_driver()
-            driver.get("https://www.google.com")
-            title = driver.title
-            driver.quit()
+            if pool is not None:
+                with pool.driver() as driver:
+                    driver.get("https://www.google.com")
+                    title = driver.title
+            else:
+                driver = get_chrome_driver()
+                driver.get("https://www.google.com")
+                title = driver.title
+                driver.quit()
             if "Google" in title:
                 st.success("✅ Driver test successful!")
                 return True
@@ -178,117 +195,227 @@ def test_driver():
         st.error(f"❌ Driver test failed: {e}")
         return False
 
-def fetch_interview_links(company: str, role: str, pages: int = 1):
-    """Scrape interview links with progress tracking"""
+def iter_interview_links(company: str, role: str, pages: int = 1, pool=None, known=None,
+                         page_deadline=DEFAULT_PAGE_DEADLINE, stop_on_known=True, crawl=None):
+    """
+    Scrape interview links with progress tracking, yielding each page's new
+    links as soon as the page is read so detail scraping can start early.
+    With `known` (normalized URLs already ingested) only new links are returned,
+    and unless `stop_on_known` is False (crawling deeper than before)
+    pagination stops at the first page that holds nothing new.
+    Waits are condition-based, bounded by `page_deadline` seconds per page.
+    `crawl`, when given, is a dict whose 'pages' is set to how deep the
+    listing was read (all of `pages` once there are no more pages).
+    """
+    crawl = {} if crawl is None else crawl
+    crawl["pages"] = 0
     base_url = "https://www.codingninjas.com/studio/experiences"
     search_url = f"{base_url}?company={company}&title={role}"
     
-    driver = get_chrome_driver()
+    driver = pool.acquire() if pool is not None else get_chrome_driver()
+    broken = False
     links = set()
     
     try:
         with st.spinner(f"🔍 Fetching interview links for {company} - {role}..."):
+            budget = PageBudget(page_deadline)
             driver.get(search_url)
-            time.sleep(3)
             
             progress_bar = st.progress(0)
+            first_link = None
             
             for page in range(pages):
                 progress_bar.progress((page + 1) / pages)
                 st.write(f"📄 Scraping page {page + 1}/{pages}")
                 
                 try:
-                    # Wait for page to load
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
+                    # Wait for the previous page's links to be replaced, then for the new ones
+                    if first_link is not None:
+                        budget.wait_for(driver, replaced(first_link), "re-render",
+                                        timeout=LINK_RERENDER_TIMEOUT, optional=True)
+                    budget.wait_for(driver, document_ready, "load")
+                    budget.wait_for(driver, EC.presence_of_element_located(EXPERIENCE_LINK_LOCATOR),
+                                    "links", optional=True)
                     
                     # Find interview links
-                    elements = driver.find_elements(By.XPATH, '//a[contains(@href, "/experiences/")]')
+                    elements = driver.find_elements(*EXPERIENCE_LINK_LOCATOR)
                     page_links = 0
+                    new_links = 0
+                    page_new = []
                     
                     for el in elements:
                         href = el.get_attribute("href")
                         if href and "/experiences/" in href:
-                            links.add(href)
                             page_links += 1
+                            if known is None or not is_known(href, known):
+                                new_links += 1
+                                if href not in links:
+                                    links.add(href)
+                                    page_new.append(href)
+                    
+                    st.write(f"   ✅ Found {page_links} links on page {page + 1} ⏱️ {budget.report()}")
+                    crawl["pages"] = page + 1
+                    
+                    if known is not None and stop_on_known and page_links and not new_links:
+                        st.write("   ⏹️ Only already-ingested links on this page, stopping pagination")
+                        break
                     
-                    st.write(f"   ✅ Found {page_links} links on page {page + 1}")
+                    if page_new:
+                        yield page_new
                     
                     # Try to go to next page
                     if page < pages - 1:
                         try:
                             next_button = driver.find_element(By.XPATH, '//button[contains(text(), "Next")]')
                             if next_button.is_enabled():
+                                first_link = elements[0] if elements else None
                                 next_button.click()
-                                time.sleep(3)
+                                budget = PageBudget(page_deadline)
                             else:
                                 st.write("   ⏭️ No more pages available")
+                                crawl["pages"] = pages
                                 break
                         except NoSuchElementException:
                             st.write("   ⏭️ Next button not found, stopping pagination")
+                            crawl["pages"] = pages
                             break
                             
                 except Exception as e:
                     st.error(f"❌ Error on page {page + 1}: {e}")
+                    broken = True
                     break
             
             progress_bar.progress(1.0)
             
     finally:
-        driver.quit()
+        if pool is not None:
+            pool.release(driver, broken=broken)
+        else:
+            driver.quit()
+
+def fetch_interview_links(company: str, role: str, pages: int = 1, pool=None, known=None,
+                          page_deadline=DEFAULT_PAGE_DEADLINE, stop_on_known=True):
+    """Scrape all interview links up front (see iter_interview_links)"""
+    return [
+        url
+        for page_new in iter_interview_links(company, role, pages, pool=pool, known=known,
+                                             page_deadline=page_deadline, stop_on_known=stop_on_known)
+        for url in page_new
+    ]
+
+def _extract_interview(driver, url, span, page_deadline=DEFAULT_PAGE_DEADLINE):
+    """Extract data from one interview URL using an existing driver"""
+    budget = PageBudget(page_deadline)
+    with span.phase("navigation"):
+        driver.get(url)
     
-    return list(links)
+    # Wait for page to load
+    with span.phase("wait"):
+        budget.wait_for(driver, EC.presence_of_element_located((By.TAG_NAME, "body")), "load")
+        budget.wait_for(driver, EC.presence_of_element_located((By.CSS_SELECTOR, "h1")), "title", optional=True)
+    
+    # Title, role, journey, rounds and description in a single script round trip
+    with span.phase("extraction"):
+        details = extract_with_driver(driver, budget.remaining())
+    description = details["description"] or details["details"] or "N/A"
+    
+    return {
+        "url": url,
+        "title": details["title"].strip(),
+        "role": details["role"].strip(),
+        "description": description.strip()
+    }
 
-def parse_interview_page(url):
-    """Extract data from one interview URL"""
-    driver = get_chrome_driver()
+def _scrape_interview_page(url, pool, fast_path, span):
+    """
+    Scrape one interview URL.
+    The browser-free HTTP fast path is tried first. Otherwise, with a DriverPool
+    the page is scraped on a pooled driver, or a throwaway driver is started
+    for this URL alone.
+    """
+    if fast_path:
+        with span.phase("fast_path"):
+            details = fetch_experience(url)
+        if details:
+            return {
+                "url": url,
+                "title": details["title"],
+                "role": details["role"],
+                "description": details["description"]
+            }
+        span.retries += 1
     
     try:
-        driver.get(url)
-        wait = WebDriverWait(driver, 15)
-        
-        # Wait for page to load
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        
-        # Extract title
-        try:
-            title = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1"))).text
-        except:
-            title = "N/A"
+        started = time.monotonic()
+        if pool is not None:
+            with pool.driver() as driver:
+                span.add("acquire", time.monotonic() - started)
+                return _extract_interview(driver, url, span)
         
-        # Extract role
+        driver = get_chrome_driver()
+        span.add("acquire", time.monotonic() - started)
         try:
-            role = driver.find_element(By.CSS_SELECTOR, "span.round-badge").text
-        except:
-            role = "N/A"
-        
-        # Extract description
-        try:
-            description = driver.find_element(By.CSS_SELECTOR, 'div[class*="experience-details"]').text
-        except:
-            try:
-                description = driver.find_element(By.CSS_SELECTOR, 'div[class*="content"]').text
-            except:
-                description = "N/A"
-        
-        return {
-            "url": url,
-            "title": title.strip(),
-            "role": role.strip(),
-            "description": description.strip()
-        }
+            return _extract_interview(driver, url, span)
+        finally:
+            driver.quit()
         
     except Exception as e:
+        span.status = "error"
         st.error(f"❌ Error scraping {url}: {e}")
         return None
-    finally:
-        driver.quit()
 
-def fetch_all_interviews(company, role, pages=1, max_threads=2):
+def parse_interview_page(url, pool=None, fast_path=True, use_cache=True, telemetry=None):
+    """Extract data from one interview URL, served from the on-disk scrape cache when possible"""
+    with (telemetry or get_telemetry()).span(url, "code360") as span:
+        cache = get_scrape_cache() if use_cache else None
+        if cache is not None:
+            with span.phase("cache"):
+                cached = cache.get_json(url, kind="code360")
+            if cached:
+                span.status = "cached"
+                span.record_text(cached.get("description"))
+                return cached
+        
+        result = _scrape_interview_page(url, pool, fast_path, span)
+        if not result:
+            span.status = "failed" if span.status == "ok" else span.status
+            return result
+        span.record_text(result["description"])
+        if cache is not None and result["description"] != "N/A":
+            cache.put_json(url, result, kind="code360")
+        return result
+
+def stream_interviews(company, role, pages, pool, max_threads=2, known=None, telemetry=None,
+                      stop_on_known=True, crawl=None):
+    """
+    Producer/consumer pipeline: links from each results page are submitted to
+    the worker pool immediately while later pages are still being paginated.
+    Yields (result, links found so far) as each interview finishes.
+    """
+    found = 0
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        pending = set()
+        for page_new in iter_interview_links(company, role, pages, pool=pool, known=known,
+                                             stop_on_known=stop_on_known, crawl=crawl):
+            found += len(page_new)
+            pending.update(executor.submit(parse_interview_page, url, pool, telemetry=telemetry) for url in page_new)
+            # Hand back whatever already finished before paginating further
+            done = {future for future in pending if future.done()}
+            pending -= done
+            for future in done:
+                yield future.result(), found
+        for future in as_completed(pending):
+            yield future.result(), found
+
+def fetch_all_interviews(company, role, pages=1, max_threads=2, incremental=False, extend=False):
     """
     Main function to fetch all interviews with Streamlit integration
     Reduced max_threads to 2 for Streamlit Cloud stability
+    With incremental=True only experiences not ingested before for this
+    company/role are scraped and returned; extend=True keeps paginating
+    through already-ingested pages to reach deeper ones. Scraped URLs and
+    how many listing pages were read are always recorded in the watermark,
+    even when nothing new turned up.
     """
     st.header(f"🎯 Scraping Interviews: {company} - {role}")
     
@@ -302,40 +429,44 @@ def fetch_all_interviews(company, role, pages=1, max_threads=2):
         st.error("❌ Failed to setup ChromeDriver")
         return pd.DataFrame()
     
-    # Test driver
-    if not test_driver():
-        st.error("❌ Driver test failed")
-        return pd.DataFrame()
-    
-    # Fetch links
-    links = fetch_interview_links(company, role, pages)
-    
-    if not links:
-        st.warning("⚠️ No interview links found")
-        return pd.DataFrame()
-    
-    st.success(f"✅ Found {len(links)} interview links")
-    
-    # Parse interviews
-    data = []
-    with st.spinner("🔍 Extracting interview data..."):
+    # One pool of long-lived drivers serves the test, link discovery and every page.
+    # The extra slot keeps link discovery from starving the detail workers.
+    with DriverPool(get_chrome_driver, max_size=max_threads + 1, max_uses=DRIVER_MAX_USES) as pool:
+        # Test driver
+        if not test_driver(pool):
+            st.error("❌ Driver test failed")
+            return pd.DataFrame()
+        
+        # Discover links and parse interviews as they stream in
+        watermarks = get_watermark_store()
+        known = watermarks.known("code360", company, role) if incremental else None
+        telemetry = ScrapeTelemetry()
+        crawl = {}
+        data = []
+        found = 0
         progress_bar = st.progress(0)
         
-        with ThreadPoolExecutor(max_workers=max_threads) as executor:
-            future_to_url = {executor.submit(parse_interview_page, url): url for url in links}
+        for i, (result, found) in enumerate(stream_interviews(company, role, pages, pool, max_threads,
+                                                              known=known, telemetry=telemetry,
+                                                              stop_on_known=not extend, crawl=crawl)):
+            if result:
+                data.append(result)
+                st.write(f"✅ Scraped {i+1}/{found}: {result['title']}")
+            else:
+                st.write(f"❌ Failed to scrape {i+1}/{found}")
             
-            for i, future in enumerate(as_completed(future_to_url)):
-                result = future.result()
-                if result:
-                    data.append(result)
-                    st.write(f"✅ Scraped {i+1}/{len(links)}: {result['title']}")
-                else:
-                    st.write(f"❌ Failed to scrape {i+1}/{len(links)}")
-                
-                progress_bar.progress((i + 1) / len(links))
+            progress_bar.progress(min((i + 1) / found, 1.0))
+        
+        watermarks.mark_depth("code360", company, role, crawl.get("pages", 0))
+        if not found:
+            st.warning("⚠️ No new interview links found" if incremental else "⚠️ No interview links found")
+            return pd.DataFrame()
+    
+    watermarks.mark("code360", company, role, [item["url"] for item in data])
     
     df = pd.DataFrame(data)
     st.success(f"🎉 Successfully scraped {len(df)} interviews!")
+    st.code(telemetry.report(), language="text")
     
     return df
 
@@ -1,85 +1,294 @@
 import re
 import json
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-import re
-from collections import defaultdict
-import json
+# One precompiled tokenizer for everything clean_and_structure extracts.
+# finditer walks the text once in C; Python only runs per token, and multi-line
+# values (approaches, resume tips) are sliced between token offsets.
+TOKEN_RE = re.compile(r"""
+    # Cheap first-character gate so the engine skips ordinary text quickly
+    (?=[\#APRTESMmDd0-9])
+    (?:
+      (?P<journey>\#\#\ Interview\ Preparation\ Journey)
+    | (?P<round>\#\#\#\ Round\ (?P<round_number>\d+))
+    | (?P<application>Application\ process\nWhere:\ (?P<application_value>[^\n]+))
+    | (?P<preparation>Preparation\nDuration:\ (?P<preparation_value>[^\n]+))
+    | (?P<resume>Resume\ tip\n)
+    | (?P<tip>Tip\ \d+:\ (?P<tip_value>[^\n]+))
+    | (?P<eligibility>Eligibility:\ (?P<eligibility_value>[^\n]+))
+    | (?P<topics>Topics:\ (?P<topics_value>[^\n]+))
+    | (?P<approach>Problem\ approach\n)
+      # "N. Title" on its own line, difficulty on the next
+    | (?P<question>^\d+\.[\ \t]+(?P<question_title>[^\n]+)\n(?P<difficulty>Easy|Moderate|Hard))
+    | (?P<numbered>\d+\.\s)
+    | (?P<solve_later>Solve\ later)
+      # "Mode: x" inline, or a bare "Mode" line with its value on the next line
+      # (the (?<=^...) lookbehind only allows the line break when the keyword
+      # starts its line). A value stops before a following Mode/Duration field.
+    | (?P<mode>[Mm][Oo][Dd][Ee]\b
+        (?:(?<=^[Mm][Oo][Dd][Ee])[:\ \t]*\n[\ \t]*|[:\ \t]*)
+        (?P<mode_value>(?:(?!\b(?i:mode|duration)\b)[^\n])+))
+    | (?P<duration>[Dd][Uu][Rr][Aa][Tt][Ii][Oo][Nn]\b
+        (?:(?<=^[Dd][Uu][Rr][Aa][Tt][Ii][Oo][Nn])[:\ \t]*\n[\ \t]*|[:\ \t]*)
+        (?P<duration_value>(?:(?!\b(?i:mode|duration)\b)[^\n])+))
+    )
+""", re.MULTILINE | re.VERBOSE)
+NON_SPACE_RE = re.compile(r'\S')
+# Round headers in a raw description; a round's text runs to the next header
+ROUND_HEADER_RE = re.compile(r'### Round(?: (\d+))?')
+LINK_RE = re.compile(r'https?://[^\s,\)]+')
+TIP_PREFIX_RE = re.compile(r'Tip \d+: ')
+
+# Key order of a structured interview record
+RECORD_KEYS = ('application_method', 'eligibility', 'preparation_duration', 'topics',
+               'tips', 'resume_tips', 'interview_rounds')
+
+
+class _InterviewBuilder:
+    """
+    State for the interview currently being read. Open multi-line captures
+    remember where they started and are sliced out of the source text when
+    the next terminating token (or the end of the interview) arrives.
+    """
+
+    def __init__(self, text, start):
+        self.text = text
+        self.start = start
+        self.data = {}
+        self.tips = []
+        self.resume_tips = []
+        self.rounds = []
+        self.round = None
+        self.question = None
+        self.approach_from = None
+        self.resume_from = None
+
+    def close_approach(self, end):
+        if self.approach_from is not None:
+            approach = self.text[self.approach_from:end].strip().replace('\n', ' ')
+            if approach and self.question is not None and not self.question['approach']:
+                self.question['approach'] = approach
+            self.approach_from = None
+
+    def close_resume_tip(self, end):
+        if self.resume_from is not None:
+            tip = self.text[self.resume_from:end]
+            m = TIP_PREFIX_RE.match(tip)
+            if m:
+                tip = tip[m.end():]
+            tip = tip.split('\n\n', 1)[0].strip().replace('\n', ' ')
+            if tip:
+                self.resume_tips.append(tip)
+            self.resume_from = None
+
+    def start_round(self, number, at):
+        self.close_approach(at)
+        self.close_resume_tip(at)
+        self.question = None
+        self.round = {
+            'round_number': number,
+            'mode': None,
+            'duration': None,
+            'type': None,
+            'questions': []
+        }
+        self.rounds.append(self.round)
+
+    def has_text(self, end):
+        return NON_SPACE_RE.search(self.text, self.start, end) is not None
+
+    def finish(self, end):
+        self.close_approach(end)
+        self.close_resume_tip(end)
+        if self.tips:
+            self.data['tips'] = self.tips
+        if self.resume_tips:
+            self.data['resume_tips'] = self.resume_tips
+        self.data['interview_rounds'] = self.rounds
+        return {key: self.data[key] for key in RECORD_KEYS if key in self.data}
+
+
+def _at_line_start(text, pos):
+    return pos == 0 or text[pos - 1] == '\n'
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+
+def iter_structured(raw_text: str):
+    """
+    Yield one structured record per interview in `raw_text` using a single
+    tokenizer pass. Interviews are delimited by '## Interview Preparation Journey'
+    and rounds by '### Round N'.
+    """
+    current = _InterviewBuilder(raw_text, 0)
+    for m in TOKEN_RE.finditer(raw_text):
+        kind = m.lastgroup
+        pos = m.start()
+        data = current.data
+
+        if kind == 'journey':
+            if current.has_text(pos):
+                yield current.finish(pos)
+            current = _InterviewBuilder(raw_text, m.end())
+        elif kind == 'round':
+            current.start_round(int(m.group('round_number')), pos)
+        elif kind == 'tip':
+            # A resume tip runs until the next "Tip N:" line
+            if current.resume_from is not None and pos > current.resume_from and _at_line_start(raw_text, pos):
+                current.close_resume_tip(pos)
+            current.tips.append(m.group('tip_value'))
+        elif kind == 'resume':
+            current.close_resume_tip(pos)
+            current.resume_from = m.end()
+        elif kind == 'application':
+            data.setdefault('application_method', m.group('application_value').strip())
+        elif kind == 'preparation':
+            data.setdefault('preparation_duration', m.group('preparation_value').strip())
+        elif kind == 'eligibility':
+            data.setdefault('eligibility', m.group('eligibility_value').strip())
+        elif kind == 'topics':
+            if 'topics' not in data:
+                data['topics'] = [topic.strip() for topic in m.group('topics_value').split(',')]
+        elif current.round is None:
+            continue
+        elif kind == 'question':
+            # The approach that follows belongs to this question, keeping them aligned
+            current.close_approach(pos)
+            current.question = {
+                'title': m.group('question_title').strip(),
+                'difficulty': m.group('difficulty'),
+                'approach': ''
+            }
+            current.round['questions'].append(current.question)
+        elif kind == 'numbered' or kind == 'solve_later':
+            # Only "N. " / "Solve later" at the start of a line end an approach
+            if _at_line_start(raw_text, pos):
+                current.close_approach(pos)
+        elif kind == 'approach':
+            current.close_approach(pos)
+            current.approach_from = m.end()
+        elif current.round[kind] is None and not (pos and _is_word_char(raw_text[pos - 1])):
+            # mode / duration: first whole-word occurrence in the round wins;
+            # drop the separator left before a following field on the same line
+            value = m.group(kind + '_value').strip().rstrip(',;|').rstrip()
+            if value:
+                current.round[kind] = value
+
+    if current.has_text(len(raw_text)):
+        yield current.finish(len(raw_text))
 
-import re
-import json
-from collections import defaultdict
 
 def clean_and_structure(raw_text: str):
-    entries = []
-    interviews = re.split(r'## Interview Preparation Journey', raw_text)
-    
-    for interview in interviews:
-        if not interview.strip():
+    """Structure every interview in `raw_text` (see iter_structured)"""
+    return list(iter_structured(raw_text))
+
+
+def round_segments(raw_text: str):
+    """
+    {round_number: (start, end)} offsets of each round's text in `raw_text`,
+    found in one scan. The first '### Round N' header of a number wins and its
+    segment ends at the next '### Round' header.
+    """
+    headers = list(ROUND_HEADER_RE.finditer(raw_text))
+    segments = {}
+    for i, header in enumerate(headers):
+        number = header.group(1)
+        if number is None or int(number) in segments:
             continue
-        
-        data = defaultdict(lambda: None)
-        # Extract application method
-        match = re.search(r'Application process\nWhere: (.+)', interview)
-        if match:
-            data['application_method'] = match.group(1).strip()
-        
-        # Extract eligibility
-        match = re.search(r'Eligibility: ([^\n]+)', interview)
-        if match:
-            data['eligibility'] = match.group(1).strip()
-
-        # Extract preparation duration
-        match = re.search(r'Preparation\nDuration: ([^\n]+)', interview)
-        if match:
-            data['preparation_duration'] = match.group(1).strip()
-
-        # Extract preparation topics
-        match = re.search(r'Topics: ([^\n]+)', interview)
-        if match:
-            data['topics'] = [topic.strip() for topic in match.group(1).split(',')]
-
-        # Extract tips
-        tips = re.findall(r'Tip \d+: (.+)', interview)
-        if tips:
-            data['tips'] = tips
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(raw_text)
+        segments[int(number)] = (header.end(), end)
+    return segments
+
+
+def round_links(raw_text: str):
+    """{round_number: [links]} with each round's links extracted once"""
+    return {
+        number: LINK_RE.findall(raw_text, start, end)
+        for number, (start, end) in round_segments(raw_text).items()
+    }
 
-        # Extract resume tips
-        resume_tips = re.findall(r'Resume tip\n(?:Tip \d+: )?(.+?)(?=\n(?:Tip \d+:|$))', interview, flags=re.DOTALL)
-        if resume_tips:
-            data['resume_tips'] = [tip.strip().replace('\n', ' ') for tip in resume_tips]
-
-        # Extract rounds
-        rounds = []
-        round_blocks = re.findall(r'### Round (\d+)(.+?)(?=### Round \d+|$)', interview, flags=re.DOTALL)
-        for round_num, round_text in round_blocks:
-            round_info = {
-                'round_number': int(round_num),
-                'mode': re.search(r'Mode[:\s]*([^\n]+)', round_text, re.IGNORECASE),
-                'duration': re.search(r'Duration[:\s]*([^\n]+)', round_text, re.IGNORECASE),
-                'type': None,
-                'questions': []
-            }
 
-            # Parse questions inside each round
-            questions = re.findall(r'\d+\.\s+(.+?)\n(?:Easy|Moderate|Hard)', round_text)
-            difficulties = re.findall(r'\d+\.\s+.+?\n(Easy|Moderate|Hard)', round_text)
-            approaches = re.findall(r'Problem approach\n(.+?)(?=\nSolve later|\n\d+\.\s|$)', round_text, re.DOTALL)
+MISSING_VALUES = (None, "", "N/A")
+
+
+def _iter_row_sources(df, text_column, metadata_columns, defaults):
+    """(text, metadata) for every non-empty row of `df`"""
+    defaults = dict(defaults or {})
+    columns = [column for column in metadata_columns if column in df.columns]
+    for text, *values in df[[text_column, *columns]].itertuples(index=False, name=None):
+        if not isinstance(text, str) or not text.strip():
+            continue
+        metadata = dict(defaults)
+        for column, value in zip(columns, values):
+            if value not in MISSING_VALUES and value == value:  # skips NaN
+                metadata[column] = value
+        yield text, metadata
 
-            for i in range(len(questions)):
-                q = {
-                    'title': questions[i].strip(),
-                    'difficulty': difficulties[i].strip() if i < len(difficulties) else 'Unknown',
-                    'approach': approaches[i].strip().replace('\n', ' ') if i < len(approaches) else ''
-                }
-                round_info['questions'].append(q)
 
-            rounds.append(round_info)
+def _structure_sources(sources):
+    for text, metadata in sources:
+        links = None
+        for entry in iter_structured(text):
+            entry.update(metadata)
+            entry["raw"] = text
+            if entry["interview_rounds"]:
+                if links is None:
+                    links = round_links(text)
+                for r in entry["interview_rounds"]:
+                    r["links"] = links.get(r["round_number"], [])
+            yield entry
+
+
+def iter_structured_rows(df, text_column="description", metadata_columns=("company", "role", "url"),
+                         defaults=None):
+    """
+    Row-wise ingestion: parse each row's description on its own and attach the
+    row's source metadata (company/role/url) plus its text as 'raw'.
+    Each round also carries the 'links' found in its segment of the text.
+    `defaults` fills metadata the row doesn't carry. Records are yielded one at
+    a time, so memory no longer grows with the concatenated corpus.
+    """
+    return _structure_sources(_iter_row_sources(df, text_column, metadata_columns, defaults))
+
+
+def _preprocess_chunk(sources):
+    """Worker entry point: structure one chunk and render its documents"""
+    structured = list(_structure_sources(sources))
+    return structured, json_to_documents(structured)
+
+
+def _chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def preprocess_rows_parallel(df, workers=None, chunk_size=64, text_column="description",
+                             metadata_columns=("company", "role", "url"), defaults=None):
+    """
+    Run clean_and_structure + json_to_documents over chunks of rows in a
+    ProcessPoolExecutor. Chunks are mapped in order, so the returned
+    (structured, documents) match the serial path exactly.
+    workers=1 runs serially in this process.
+    """
+    sources = _iter_row_sources(df, text_column, metadata_columns, defaults)
+    if workers == 1:
+        return _preprocess_chunk(list(sources))
 
-        data['interview_rounds'] = rounds
-        entries.append(dict(data))
+    structured, documents = [], []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_structured, chunk_documents in executor.map(_preprocess_chunk, _chunked(sources, chunk_size)):
+            structured.extend(chunk_structured)
+            documents.extend(chunk_documents)
+    return structured, documents
 
-    return entries
 
 def json_to_documents(json_data):
     """
@@ -87,6 +296,8 @@ def json_to_documents(json_data):
     Supports full interview round details, coding/system/puzzle questions, and links.
     """
     documents = []
+    # Records without precomputed round links share one index per raw text
+    link_index = {}
 
     for entry in json_data:
         lines = []
@@ -130,9 +341,10 @@ def json_to_documents(json_data):
 
         for r in rounds:
             rnum = r.get("round_number", "N/A")
-            mode = r.get("mode", "N/A")
-            duration = r.get("duration", "N/A")
-            interview_date = r.get("interview_date", "N/A")
+            # Unmatched fields are stored as None; render them as N/A
+            mode = r.get("mode") or "N/A"
+            duration = r.get("duration") or "N/A"
+            interview_date = r.get("interview_date") or "N/A"
 
             lines.append(f"\nRound {rnum} | Mode: {mode} | Duration: {duration} | Date: {interview_date}")
 
@@ -163,15 +375,16 @@ def json_to_documents(json_data):
                     lines.append(f"  Approach: {sdq['approach']}")
 
             # Round-level links (if exist in raw)
-            raw_text = entry.get("raw", "")
-            round_number_str = f"### Round {rnum}"
-            if round_number_str in raw_text:
-                round_text = raw_text.split(round_number_str, 1)[1].split("### Round", 1)[0]
-                links_match = re.findall(r"https?://[^\s,\)]+", round_text)
-                if links_match:
-                    lines.append("  Links:")
-                    for l in links_match:
-                        lines.append(f"    - {l}")
+            links_match = r.get("links")
+            if links_match is None:
+                raw_text = entry.get("raw", "")
+                if raw_text not in link_index:
+                    link_index[raw_text] = round_links(raw_text)
+                links_match = link_index[raw_text].get(rnum, [])
+            if links_match:
+                lines.append("  Links:")
+                for l in links_match:
+                    lines.append(f"    - {l}")
 
         documents.append("\n".join(lines).strip())
 
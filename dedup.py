@@ -0,0 +1,155 @@
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.8           # estimated Jaccard similarity treated as a duplicate
+DEFAULT_QUESTION_THRESHOLD = 0.8  # same, over the set of normalized question titles
+MIN_QUESTIONS = 3                 # fewer titles than this are too weak a signal on their own
+CONFIRM_THRESHOLD = 0.5           # text similarity a question-title match also needs
+NUM_PERM = 128
+SHINGLE_SIZE = 5                  # words per shingle
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+_MERSENNE = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase alphanumeric words of a question title, single-spaced"""
+    return " ".join(WORD_RE.findall(str(title).lower()))
+
+
+def shingles(text: str, size=SHINGLE_SIZE):
+    """32-bit hashes of the word `size`-grams of `text`"""
+    words = WORD_RE.findall(str(text).lower())
+    if len(words) < size:
+        return {zlib.crc32(" ".join(words).encode())} if words else set()
+    return {zlib.crc32(" ".join(words[i:i + size]).encode()) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """Fixed-seed MinHash, so signatures are comparable across runs"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, _MERSENNE, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, _MERSENNE, size=num_perm, dtype=np.uint64)
+
+    def signature(self, features):
+        x = np.fromiter(features, dtype=np.uint64, count=len(features))
+        return (((x[:, None] * self.a + self.b) % _MERSENNE) & _MAX_HASH).min(axis=0)
+
+
+def similarity(sig_a, sig_b) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+def lsh_bands(threshold, num_perm=NUM_PERM):
+    """(bands, rows) whose S-curve midpoint (1/b)^(1/r) is closest to `threshold`"""
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class LSHIndex:
+    """Banded LSH over MinHash signatures; query returns candidate keys only"""
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM):
+        self.bands, self.rows = lsh_bands(threshold, num_perm)
+        self._buckets = [defaultdict(list) for _ in range(self.bands)]
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def insert(self, key, signature):
+        for band, bucket in self._band_keys(signature):
+            self._buckets[band][bucket].append(key)
+
+    def query(self, signature):
+        candidates = set()
+        for band, bucket in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(bucket, ()))
+        return candidates
+
+
+def unique_positions(feature_sets, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, confirm=None):
+    """
+    Positions to keep from a sequence of feature sets: each item is dropped if
+    an earlier kept item is at least `threshold` similar (and, when given,
+    `confirm(pos, earlier_pos)` agrees). Empty sets are always kept. First
+    occurrence wins, so the result is deterministic.
+    """
+    hasher = MinHasher(num_perm)
+    index = LSHIndex(threshold, num_perm)
+    signatures = {}
+    kept = []
+    for pos, features in enumerate(feature_sets):
+        if not features:
+            kept.append(pos)
+            continue
+        signature = hasher.signature(features)
+        if any(similarity(signature, signatures[c]) >= threshold and (confirm is None or confirm(pos, c))
+               for c in index.query(signature)):
+            continue
+        index.insert(pos, signature)
+        signatures[pos] = signature
+        kept.append(pos)
+    return kept
+
+
+def dedupe_rows(df, text_column="description", threshold=DEFAULT_THRESHOLD):
+    """Drop scraped rows whose text near-duplicates an earlier row"""
+    if df.empty or text_column not in df.columns:
+        return df
+    texts = df[text_column].fillna("").astype(str)
+    kept = unique_positions((shingles(text) for text in texts), threshold)
+    return df.iloc[kept].reset_index(drop=True)
+
+
+def _record_text(record):
+    parts = list(record.tips) + list(record.resume_tips)
+    for r in record.rounds:
+        for q in r.questions:
+            parts.append(q.title)
+            parts.append(q.approach)
+    return "\n".join(parts)
+
+
+def _title_features(record):
+    titles = {normalize_title(q.title) for r in record.rounds for q in r.questions}
+    titles.discard("")
+    return {zlib.crc32(t.encode()) for t in titles} if len(titles) >= MIN_QUESTIONS else set()
+
+
+def dedupe_records(records, threshold=DEFAULT_THRESHOLD, question_threshold=DEFAULT_QUESTION_THRESHOLD,
+                   confirm_threshold=CONFIRM_THRESHOLD):
+    """
+    Drop Interview records that near-duplicate an earlier one, either by their
+    text (tips, question titles and approaches) or by their set of normalized
+    question titles together with text at least `confirm_threshold` similar.
+    Popular problems are asked in many distinct interviews, so shared titles
+    alone never make a duplicate. Run before json_to_documents so copies are
+    never embedded.
+    """
+    texts = [shingles(_record_text(r)) for r in records]
+    kept = unique_positions(texts, threshold)
+    records, texts = [records[pos] for pos in kept], [texts[pos] for pos in kept]
+
+    hasher = MinHasher()
+    signatures = [hasher.signature(features) if features else None for features in texts]
+
+    def same_text(pos, other):
+        a, b = signatures[pos], signatures[other]
+        return a is not None and b is not None and similarity(a, b) >= confirm_threshold
+
+    kept = unique_positions((_title_features(r) for r in records), question_threshold, confirm=same_text)
+    return [records[pos] for pos in kept]
@@ -0,0 +1,160 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    TimeoutException,
+    WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+# Errors after which the browser session itself is gone
+SESSION_ERRORS = (InvalidSessionIdException, NoSuchWindowException, ConnectionError, MaxRetryError, ProtocolError)
+# WebDriverException messages that mean Chrome crashed or the connection dropped
+CRASH_MARKERS = ("chrome not reachable", "session deleted", "tab crashed", "disconnected",
+                 "target window already closed", "no such session")
+
+
+def is_session_error(exc):
+    """True for failures of the browser session or its connection, not of the page"""
+    if isinstance(exc, SESSION_ERRORS):
+        return True
+    if isinstance(exc, TimeoutException) or not isinstance(exc, WebDriverException):
+        return False
+    return any(marker in (exc.msg or "").lower() for marker in CRASH_MARKERS)
+
+
+class DriverPool:
+    """
+    Bounded pool of long-lived WebDriver instances.
+    Workers check a driver out, use it for one page and hand it back, so a
+    scrape pays for at most `max_size` browser launches instead of one per URL.
+    Drivers are health-checked on checkout and recycled after `max_uses`
+    pages or as soon as their session fails. Browser calls (health checks,
+    launches, quits) run outside the pool lock.
+    """
+
+    def __init__(self, factory, max_size=2, max_uses=25):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._factory = factory
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self._idle = []          # drivers ready to be checked out
+        self._uses = {}          # id(driver) -> pages served so far
+        self._size = 0           # live drivers, idle or checked out
+        self._closed = False
+        self._cond = threading.Condition()
+        self.launches = 0
+
+    def _is_healthy(self, driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _forget(self, driver):
+        """Free a driver's slot. Caller must hold the lock and quit the driver after releasing it."""
+        self._uses.pop(id(driver), None)
+        self._size -= 1
+        self._cond.notify()
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self, timeout=None):
+        """Check out a healthy driver, launching one if the pool has room."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            driver = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("DriverPool is closed")
+                    if self._idle:
+                        driver = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a free WebDriver")
+                    self._cond.wait(remaining)
+
+            if driver is None:
+                break
+            # The popped driver is checked out, so other workers don't wait on its health check
+            if self._is_healthy(driver):
+                return driver
+            with self._cond:
+                self._forget(driver)
+            self._quit(driver)
+
+        # Launch outside the lock; Chrome startup is the slow part.
+        try:
+            driver = self._factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._uses[id(driver)] = 0
+            self.launches += 1
+        return driver
+
+    def release(self, driver, broken=False):
+        """Return a driver to the pool, recycling it if worn out or broken."""
+        with self._cond:
+            uses = self._uses.get(id(driver), 0) + 1
+            if not (broken or self._closed or uses >= self.max_uses):
+                self._uses[id(driver)] = uses
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+            self._forget(driver)
+        self._quit(driver)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """
+        Context manager around acquire/release.
+        A session or connection failure inside the block marks the driver as
+        crashed so it is quit instead of being handed to the next worker;
+        page errors such as a load timeout leave the driver in the pool.
+        """
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception as exc:
+            broken = is_session_error(exc)
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self):
+        """Quit all idle drivers; checked-out ones are quit when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for driver in idle:
+                self._forget(driver)
+            self._cond.notify_all()
+        for driver in idle:
+            self._quit(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
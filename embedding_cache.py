@@ -0,0 +1,132 @@
+import os
+import time
+import random
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from scrape_cache import CACHE_PATH, content_hash
+
+EMBED_BATCH_SIZE = 64    # texts per backend call
+EMBED_CONCURRENCY = 4    # backend calls in flight
+EMBED_MAX_RETRIES = 4
+EMBED_BACKOFF = 1.0      # seconds before the first retry, doubled each attempt
+LOOKUP_CHUNK = 500       # keys per SQL IN (...) lookup
+
+
+class EmbeddingStore:
+    """SQLite table of float32 vectors keyed by (model, sha256 of the text)"""
+
+    def __init__(self, path=CACHE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (model, hash)
+            )
+        """)
+        self._conn.commit()
+
+    def get_many(self, model, hashes):
+        """{hash: vector} for the hashes already stored"""
+        found = {}
+        hashes = list(hashes)
+        with self._lock:
+            for start in range(0, len(hashes), LOOKUP_CHUNK):
+                chunk = hashes[start:start + LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT hash, vector FROM embedding_cache WHERE model = ? AND hash IN ({','.join('?' * len(chunk))})",
+                    (model, *chunk),
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, model, items):
+        """Store (hash, vector) pairs"""
+        now = time.time()
+        rows = [(model, key, len(vector), np.asarray(vector, dtype=np.float32).tobytes(), now) for key, vector in items]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embedding_cache VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that only sends cache misses to the backend.
+    Documents are looked up by (model, sha256(text)); misses are de-duplicated
+    and embedded in batches of `batch_size`, up to `max_concurrency` batches
+    at a time, each retried with exponential backoff. Queries pass straight
+    through since they are rarely repeated.
+    """
+
+    def __init__(self, backend, model, store=None, batch_size=EMBED_BATCH_SIZE,
+                 max_concurrency=EMBED_CONCURRENCY, max_retries=EMBED_MAX_RETRIES, backoff=EMBED_BACKOFF):
+        self.backend = backend
+        self.model = model
+        self.store = store or get_embedding_store()
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.hits = 0
+        self.misses = 0
+
+    def _embed_batch(self, texts):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.backend.embed_documents(texts)
+            except Exception:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self.backoff * (2 ** attempt) * (1 + random.random() * 0.25))
+
+    def embed_documents(self, texts):
+        keys = [content_hash(text) for text in texts]
+        vectors = self.store.get_many(self.model, set(keys))
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+        self.hits += len(texts) - sum(1 for key in keys if key in missing)
+        self.misses += len(missing)
+
+        if missing:
+            pending = list(missing.items())
+            batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                results = executor.map(lambda batch: self._embed_batch([text for _, text in batch]), batches)
+                for batch, embedded in zip(batches, results):
+                    items = [(key, vector) for (key, _), vector in zip(batch, embedded)]
+                    # Store each batch as it lands so a later failure keeps the finished work
+                    self.store.put_many(self.model, items)
+                    vectors.update(items)
+
+        return [list(vectors[key]) for key in keys]
+
+    def embed_query(self, text):
+        return self.backend.embed_query(text)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_embedding_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = EmbeddingStore()
+        return _store
@@ -0,0 +1,218 @@
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import etree, html as lxml_html
+
+# Selectors shared with the Selenium scrapers
+JOURNEY_ID = "ie-overall-user-experience"
+ROUND_CONTAINER_BASE_ID = "interview-round-v2-"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+
+# Elements that start a new line in the rendered text, mirroring Selenium's .text
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tr", "ul",
+}
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg"}
+
+_session = None
+
+
+def get_session():
+    """Shared keep-alive session so repeated page fetches reuse connections"""
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=1)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": USER_AGENT})
+        _session = session
+    return _session
+
+
+def render_description(journey, rounds):
+    """
+    Build the description text produced by the scrapers:
+    '## Interview Preparation Journey' followed by one '### Round N' per round.
+    """
+    description_parts = []
+    if journey:
+        description_parts.append("## Interview Preparation Journey\n" + journey.strip())
+    if rounds:
+        description_parts.append("\n\n## Interview Rounds")
+        for round_index, round_text in enumerate(rounds, 1):
+            description_parts.append(f"\n\n### Round {round_index}\n" + round_text.strip())
+    return "\n".join(description_parts)
+
+
+def _collect_text(element, out):
+    tag = element.tag if isinstance(element.tag, str) else ""
+    if tag in SKIP_TAGS:
+        if element.tail:
+            out.append(element.tail)
+        return
+
+    is_block = tag in BLOCK_TAGS
+    if is_block:
+        out.append("\n")
+    if tag == "br":
+        out.append("\n")
+    if element.text and tag:
+        out.append(element.text)
+    for child in element:
+        _collect_text(child, out)
+    if is_block:
+        out.append("\n")
+    if element.tail:
+        out.append(element.tail)
+
+
+def inner_text(element):
+    """Approximate the browser's innerText: one line per block, collapsed whitespace"""
+    out = []
+    _collect_text(element, out)
+    lines = (re.sub(r"[ \t\r\f\v\xa0]+", " ", line).strip() for line in "".join(out).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _first_text(doc, xpath):
+    found = doc.xpath(xpath)
+    return inner_text(found[0]) if found else "N/A"
+
+
+def parse_experience_html(page_html):
+    """
+    Parse a server-rendered Code360 experience page.
+    Returns a dict with title, role, journey, rounds and description, or None
+    when neither the journey nor any round container is present.
+    """
+    doc = lxml_html.fromstring(page_html)
+
+    journey_nodes = doc.xpath(f'//*[@id="{JOURNEY_ID}"]')
+    journey = inner_text(journey_nodes[0]) if journey_nodes else ""
+
+    rounds = []
+    round_index = 1
+    while True:
+        round_nodes = doc.xpath(f'//*[@id="{ROUND_CONTAINER_BASE_ID}{round_index}"]')
+        if not round_nodes:
+            break
+        rounds.append(inner_text(round_nodes[0]))
+        round_index += 1
+
+    if not journey and not rounds:
+        return None
+
+    return {
+        "title": _first_text(doc, "//h1"),
+        "role": _first_text(doc, '//span[contains(concat(" ", normalize-space(@class), " "), " round-badge ")]'),
+        "journey": journey,
+        "rounds": rounds,
+        "description": render_description(journey, rounds),
+    }
+
+
+def fetch_experience(url, timeout=10):
+    """
+    Browser-free fast path: fetch the page over the pooled session and parse it.
+    Returns None when the page can't be fetched or lacks the expected content,
+    in which case callers should fall back to Selenium.
+    """
+    try:
+        resp = get_session().get(url, timeout=timeout)
+        resp.raise_for_status()
+    except requests.RequestException:
+        return None
+    try:
+        return parse_experience_html(resp.content)
+    except (etree.ParserError, ValueError):
+        # Empty or comment-only body: nothing to parse, let the browser try
+        return None
+
+
+# Upper bound for the expanded journey to render after "continue reading"
+EXPAND_TIMEOUT = 5.0
+# ... and how long it must stay unchanged to count as rendered
+EXPAND_QUIET_MS = 300
+
+# Runs inside the browser: expands "continue reading", waits until the button is
+# gone or the journey stops changing (watched with a MutationObserver, checked
+# every animation frame, bounded by arguments[0] ms), then collects the journey,
+# every round and the page metadata so the whole page costs one WebDriver round trip.
+EXTRACT_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const timeoutMs = arguments[0];
+const text = (el) => el ? el.innerText.trim() : "";
+const collect = () => {
+    const rounds = [];
+    for (let i = 1; ; i++) {
+        const el = document.getElementById("%(round_base)s" + i);
+        if (!el) break;
+        rounds.push(text(el));
+    }
+    done({
+        title: text(document.querySelector("h1")),
+        role: text(document.querySelector("span.round-badge")),
+        journey: text(document.getElementById("%(journey_id)s")),
+        rounds: rounds,
+        details: text(document.querySelector('div[class*="experience-details"]') ||
+                      document.querySelector('div[class*="content"]')),
+        fallback: text(document.querySelector("div.blog-body-content")),
+    });
+};
+const button = document.querySelector("#continue-reading-ie-cta-container button");
+if (!button) { collect(); return; }
+
+const started = performance.now();
+let changedAt = null;
+let finished = false;
+const observer = new MutationObserver(() => { changedAt = performance.now(); });
+observer.observe(document.getElementById("%(journey_id)s") || document.body,
+                 {childList: true, subtree: true, characterData: true});
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    collect();
+};
+const timer = setTimeout(finish, timeoutMs);
+const check = () => {
+    if (finished) return;
+    const gone = !button.isConnected || button.offsetParent === null;
+    const quietSince = changedAt === null ? started : changedAt;
+    if ((gone || changedAt !== null) && performance.now() - quietSince >= %(quiet_ms)d) {
+        finish();
+    } else {
+        requestAnimationFrame(check);
+    }
+};
+button.click();
+requestAnimationFrame(check);
+""" % {"round_base": ROUND_CONTAINER_BASE_ID, "journey_id": JOURNEY_ID, "quiet_ms": EXPAND_QUIET_MS}
+
+
+def extract_with_driver(driver, timeout=EXPAND_TIMEOUT):
+    """
+    Extract an experience page already loaded in `driver` with a single
+    injected script. Expanding "continue reading" may take up to `timeout`
+    seconds (pass what is left of the page budget). Returns the same keys as
+    parse_experience_html plus the raw 'details' and 'fallback' container texts.
+    """
+    timeout = max(min(timeout, EXPAND_TIMEOUT), 0.0)
+    data = driver.execute_async_script(EXTRACT_SCRIPT, int(timeout * 1000)) or {}
+    journey = data.get("journey") or ""
+    rounds = data.get("rounds") or []
+    return {
+        "title": data.get("title") or "N/A",
+        "role": data.get("role") or "N/A",
+        "journey": journey,
+        "rounds": rounds,
+        "details": data.get("details") or "",
+        "fallback": data.get("fallback") or "",
+        "description": render_description(journey, rounds),
+    }
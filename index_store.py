@@ -0,0 +1,385 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+import faiss
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+
+from scrape_cache import content_hash, normalize_key
+from lexical_index import BM25Index, reciprocal_rank_fusion
+
+INDEX_DIR = os.environ.get("PREPGENIE_INDEX_DIR", os.path.join(".cache", "indexes"))
+
+# Every company/role lives in one shared index under this folder
+SHARED_INDEX = "shared"
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = "index.faiss"
+DOCS_FILE = "docs.json"
+
+# Rebuild the index from its surviving vectors once this share of it is replaced
+COMPACT_RATIO = 0.3
+
+# Hybrid search: candidates taken from each ranking before fusion, and how long a
+# query embedding may take before the search falls back to BM25 alone
+FETCH_K_FACTOR = 4
+QUERY_EMBED_TIMEOUT = 5.0
+SEARCH_MODES = ("hybrid", "dense", "lexical")
+
+_embed_pool = ThreadPoolExecutor(max_workers=2)
+
+
+def corpus_hash(texts):
+    """Order-sensitive hash of the document texts an index was built from"""
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(hashlib.sha256(text.encode("utf-8")).digest())
+    return digest.hexdigest()
+
+
+def partition_key(company, role):
+    return f"{normalize_key(company)}|{normalize_key(role)}"
+
+
+def _read_index(path, mmap=True):
+    """Memory-map the index when this FAISS build and index type allow it"""
+    if mmap:
+        try:
+            return faiss.read_index(path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            pass
+    return faiss.read_index(path)
+
+
+def build_documents(texts, records, company, role):
+    """
+    Documents for one company/role with stable IDs:
+    '<company|role>:<source url>#<n>' for the n-th interview of a URL, or the
+    text's hash when there is no URL. Metadata carries the company, role,
+    round numbers and source used to pre-filter searches, and a
+    'source_hash' that lets an update tell which documents changed.
+    """
+    partition = partition_key(company, role)
+    docs = []
+    seen = {}
+    for text, record in zip(texts, records):
+        if record.url:
+            n = seen.get(record.url, 0)
+            seen[record.url] = n + 1
+            doc_id = f"{partition}:{record.url}#{n}"
+        else:
+            doc_id = f"{partition}:{content_hash(text)}"
+        docs.append(Document(
+            page_content=text,
+            metadata={
+                "doc_id": doc_id,
+                "partition": partition,
+                "company": company,
+                "role": role,
+                "rounds": [r.round_number for r in record.rounds],
+                "source": record.url,
+                "source_hash": content_hash(text),
+            },
+        ))
+    return docs
+
+
+def _compact(vectorstore, keep_ids):
+    """Fresh index holding only `keep_ids`, built from stored vectors without re-embedding"""
+    index = vectorstore.index
+    positions = [pos for pos, doc_id in sorted(vectorstore.index_to_docstore_id.items()) if doc_id in keep_ids]
+    fresh = faiss.index_factory(index.d, "Flat", index.metric_type)
+    if positions:
+        fresh.add(index.reconstruct_n(0, index.ntotal)[positions])
+    ids = [vectorstore.index_to_docstore_id[pos] for pos in positions]
+    return FAISS(
+        embedding_function=vectorstore.embedding_function,
+        index=fresh,
+        docstore=InMemoryDocstore({doc_id: vectorstore.docstore.search(doc_id) for doc_id in ids}),
+        index_to_docstore_id=dict(enumerate(ids)),
+        distance_strategy=vectorstore.distance_strategy,
+    )
+
+
+class IndexStore:
+    """
+    One FAISS index shared by every company/role, persisted with a manifest
+    recording the embedding model, dimension and a corpus hash per
+    company/role partition. The index is loaded once per process (memory
+    mapped where FAISS allows) and searches are pre-filtered to a partition,
+    round or source with an ID selector, so any combination is served from
+    the same memory. A BM25 index over the same documents is built alongside
+    for hybrid search. The manifest is written last, which makes it the
+    commit marker for a save.
+    """
+
+    def __init__(self, root=INDEX_DIR):
+        self.folder = os.path.join(root, SHARED_INDEX)
+        self._lock = threading.RLock()
+        self._vectorstore = None
+        self._writable = False
+        self._selections = {}
+        self._bm25 = None
+
+    def manifest(self):
+        path = os.path.join(self.folder, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def is_fresh(self, company, role, texts_hash, model):
+        manifest = self.manifest()
+        return (bool(manifest) and manifest["model"] == model
+                and manifest["partitions"].get(partition_key(company, role)) == texts_hash)
+
+    def _read(self, embeddings, mmap=True):
+        manifest = self.manifest()
+        if not manifest:
+            return None
+        try:
+            index = _read_index(os.path.join(self.folder, INDEX_FILE), mmap)
+            with open(os.path.join(self.folder, DOCS_FILE), encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, RuntimeError, ValueError):
+            return None
+        if index.d != manifest["dim"] or index.ntotal != len(saved):
+            return None
+
+        docstore = InMemoryDocstore({
+            item["id"]: Document(page_content=item["page_content"], metadata=item.get("metadata") or {})
+            for item in saved
+        })
+        return FAISS(
+            embedding_function=embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id={position: item["id"] for position, item in enumerate(saved)},
+        )
+
+    def _current(self, embeddings, model, writable=False):
+        """The in-process shared vectorstore, read from disk on first use"""
+        if self._vectorstore is not None and (self._writable or not writable):
+            return self._vectorstore
+        manifest = self.manifest()
+        if not manifest or manifest["model"] != model:
+            return None
+        vectorstore = self._read(embeddings, mmap=not writable)
+        if vectorstore is not None:
+            self._vectorstore, self._writable = vectorstore, writable
+            self._selections, self._bm25 = {}, None
+        return vectorstore
+
+    def load(self, company, role, embeddings, texts_hash, model):
+        """The shared vectorstore if company/role is indexed and fresh, else None"""
+        with self._lock:
+            if not self.is_fresh(company, role, texts_hash, model):
+                return None
+            return self._current(embeddings, model)
+
+    def update(self, company, role, docs, embeddings, texts_hash, model):
+        """
+        Bring the company/role partition of the shared index in line with
+        `docs` (from build_documents) and save it. Only documents that are
+        new or whose source changed are embedded; removed or changed ones are
+        deleted by ID, leaving other partitions untouched. When more than
+        COMPACT_RATIO of the index goes, it is rebuilt from the kept vectors.
+        Starts from scratch when there is no index for this model yet.
+        """
+        partition = partition_key(company, role)
+        wanted = {doc.metadata["doc_id"]: doc for doc in docs}
+        with self._lock:
+            vectorstore = self._current(embeddings, model, writable=True)
+            partitions = dict(self.manifest()["partitions"]) if vectorstore is not None else {}
+            if vectorstore is None:
+                vectorstore = FAISS.from_documents(list(wanted.values()), embeddings, ids=list(wanted))
+            else:
+                existing = {}
+                for doc_id in vectorstore.index_to_docstore_id.values():
+                    metadata = vectorstore.docstore.search(doc_id).metadata
+                    if metadata.get("partition") == partition:
+                        existing[doc_id] = metadata.get("source_hash")
+                stale = {
+                    doc_id for doc_id, source_hash in existing.items()
+                    if doc_id not in wanted or wanted[doc_id].metadata["source_hash"] != source_hash
+                }
+                added = [doc_id for doc_id in wanted if doc_id not in existing or doc_id in stale]
+                if len(stale) > COMPACT_RATIO * max(vectorstore.index.ntotal, 1):
+                    keep = set(vectorstore.index_to_docstore_id.values()) - stale
+                    vectorstore = _compact(vectorstore, keep)
+                elif stale:
+                    vectorstore.delete(list(stale))
+                if added:
+                    vectorstore.add_documents([wanted[doc_id] for doc_id in added], ids=added)
+
+            partitions[partition] = texts_hash
+            self._vectorstore, self._writable = vectorstore, True
+            self._selections, self._bm25 = {}, None
+            self.save(vectorstore, partitions, model)
+            return vectorstore
+
+    def save(self, vectorstore, partitions, model):
+        saved = []
+        for position in range(vectorstore.index.ntotal):
+            doc_id = vectorstore.index_to_docstore_id[position]
+            doc = vectorstore.docstore.search(doc_id)
+            saved.append({"id": doc_id, "page_content": doc.page_content, "metadata": doc.metadata})
+        manifest = {
+            "model": model,
+            "dim": vectorstore.index.d,
+            "count": vectorstore.index.ntotal,
+            "partitions": partitions,
+            "created_at": time.time(),
+        }
+
+        with self._lock:
+            os.makedirs(self.folder, exist_ok=True)
+            manifest_path = os.path.join(self.folder, MANIFEST_FILE)
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            faiss.write_index(vectorstore.index, os.path.join(self.folder, INDEX_FILE))
+            with open(os.path.join(self.folder, DOCS_FILE), "w", encoding="utf-8") as f:
+                json.dump(saved, f, ensure_ascii=False)
+            with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(manifest_path + ".tmp", manifest_path)
+
+    def _selection(self, company, role, round_number, source):
+        """Index positions matching the filters (None = no filtering), cached until the next update"""
+        if company is None and role is None and round_number is None and source is None:
+            return None
+        key = (company and normalize_key(company), role and normalize_key(role), round_number, source)
+        if key not in self._selections:
+            vectorstore = self._vectorstore
+            positions = []
+            for position, doc_id in vectorstore.index_to_docstore_id.items():
+                metadata = vectorstore.docstore.search(doc_id).metadata
+                if key[0] is not None and normalize_key(metadata.get("company") or "") != key[0]:
+                    continue
+                if key[1] is not None and normalize_key(metadata.get("role") or "") != key[1]:
+                    continue
+                if round_number is not None and round_number not in (metadata.get("rounds") or ()):
+                    continue
+                if source is not None and metadata.get("source") != source:
+                    continue
+                positions.append(position)
+            self._selections[key] = np.asarray(positions, dtype=np.int64)
+        return self._selections[key]
+
+    def _lexical_index(self):
+        """BM25 over the documents in FAISS position order, rebuilt after each update"""
+        if self._bm25 is None:
+            vectorstore = self._vectorstore
+            self._bm25 = BM25Index([
+                vectorstore.docstore.search(vectorstore.index_to_docstore_id[position]).page_content
+                for position in range(vectorstore.index.ntotal)
+            ])
+        return self._bm25
+
+    def _dense(self, vector, k, positions):
+        params = faiss.SearchParameters(sel=faiss.IDSelectorBatch(positions)) if positions is not None else None
+        _, found = self._vectorstore.index.search(vector, k, params=params)
+        return [int(p) for p in found[0] if p != -1]
+
+    def _embed_query(self, embeddings, query):
+        """Query vector, or None when the embedding call fails or is too slow"""
+        future = _embed_pool.submit(embeddings.embed_query, query)
+        try:
+            return np.asarray([future.result(timeout=QUERY_EMBED_TIMEOUT)], dtype=np.float32)
+        except Exception:  # includes the timeout
+            return None
+
+    def _documents(self, positions):
+        vectorstore = self._vectorstore
+        return [vectorstore.docstore.search(vectorstore.index_to_docstore_id[p]) for p in positions]
+
+    def search(self, embeddings, query, k=5, company=None, role=None, round_number=None, source=None,
+               mode="hybrid"):
+        """
+        Top-k documents for `query` among those matching the filters.
+        'hybrid' fuses dense and BM25 rankings with reciprocal rank fusion.
+        Keyword queries of terms rare among the filtered documents are served
+        by BM25 alone, with no embedding request, as long as it finds
+        something; a failed or slow embedding call also falls back to BM25.
+        'dense' and 'lexical' use one ranking.
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"mode must be one of {SEARCH_MODES}")
+        fetch_k = k * FETCH_K_FACTOR
+        with self._lock:
+            if self._vectorstore is None or self._vectorstore.index.ntotal == 0:
+                return []
+            positions = self._selection(company, role, round_number, source)
+            if positions is not None and not len(positions):
+                return []
+            bm25 = self._lexical_index()
+            if mode == "lexical" or (mode == "hybrid" and bm25.is_lexical(query, positions)):
+                lexical = [p for p, _ in bm25.search(query, k, positions)]
+                if lexical or mode == "lexical":
+                    return self._documents(lexical)
+
+        vector = self._embed_query(embeddings, query)
+        if vector is None and mode == "dense":
+            raise RuntimeError("query embedding failed")
+
+        with self._lock:
+            if self._vectorstore is None or self._vectorstore.index.ntotal == 0:
+                return []
+            # Looked up again: an update may have replaced the index meanwhile
+            positions = self._selection(company, role, round_number, source)
+            if positions is not None and not len(positions):
+                return []
+            rankings = []
+            if mode != "dense":
+                rankings.append([p for p, _ in self._lexical_index().search(query, fetch_k, positions)])
+            if vector is not None:
+                rankings.append(self._dense(vector, fetch_k, positions))
+            ranked = reciprocal_rank_fusion(rankings, k) if len(rankings) > 1 else rankings[0][:k]
+            return self._documents(ranked)
+
+    def retriever(self, embeddings, k=5, company=None, role=None, round_number=None, source=None,
+                  mode="hybrid"):
+        return FilteredRetriever(store=self, embeddings=embeddings, k=k, company=company, role=role,
+                                 round_number=round_number, source=source, mode=mode)
+
+    def drop(self):
+        with self._lock:
+            self._vectorstore, self._writable, self._selections, self._bm25 = None, False, {}, None
+            shutil.rmtree(self.folder, ignore_errors=True)
+
+
+class FilteredRetriever(BaseRetriever):
+    """Hybrid retriever over the shared index, pre-filtered to a company/role/round/source"""
+
+    store: Any
+    embeddings: Any
+    k: int = 5
+    company: Optional[str] = None
+    role: Optional[str] = None
+    round_number: Optional[int] = None
+    source: Optional[str] = None
+    mode: str = "hybrid"
+
+    def _get_relevant_documents(self, query, *, run_manager=None) -> List[Document]:
+        return self.store.search(self.embeddings, query, self.k, company=self.company, role=self.role,
+                                 round_number=self.round_number, source=self.source, mode=self.mode)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_index_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = IndexStore()
+        return _store
@@ -5,10 +5,16 @@ import streamlit as st
 import asyncio
 import os
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
-from langchain_core.documents import Document
-from langchain_community.vectorstores import FAISS
 from langchain.chains import ConversationalRetrievalChain
-from data_preprocessor import clean_and_structure, json_to_documents
+from data_preprocessor import iter_structured_rows, json_to_documents
+from interview_records import to_dicts, to_records
+from snapshot_store import get_snapshot_store
+from watermarks import get_watermark_store
+from dedup import DEFAULT_THRESHOLD, dedupe_records
+from question_catalog import build_catalog, load_aliases
+from analytics import CorpusAnalytics, route_query
+from index_store import build_documents, corpus_hash, get_index_store
+from embedding_cache import CachedEmbeddings
 from code360 import fetch_all_interviews as fetch_interview_data
 from prompt import get_prompt
 from pdfgen import pdfgenerator  # Must return BytesIO or bytes PDF
@@ -72,21 +78,48 @@ def get_llm():
     )
 
 # 🧠 Cached embedding model
+EMBEDDING_MODEL = "models/gemini-embedding-exp-03-07"
+
 @st.cache_resource
 def get_embeddings():
-    return GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-exp-03-07")
+    # Chunks embedded by an earlier build are served from the local cache
+    return CachedEmbeddings(GoogleGenerativeAIEmbeddings(model=EMBEDDING_MODEL), EMBEDDING_MODEL)
 
 # 📦 Vectorstore + raw data loader
 @st.cache_resource(show_spinner="Fetching and embedding interview data...")
-def load_vectorstore(company: str, role: str, pages: int):
-    df = fetch_interview_data(company, role, pages)
-    raw_text = df['description'].str.cat(sep=' ')
-    structured = clean_and_structure(raw_text)
-    chunks = json_to_documents(structured)
-    docs = [Document(page_content=chunk) for chunk in chunks]
+def load_vectorstore(company: str, role: str, pages: int, refresh: bool = False,
+                     dedup_threshold: float = DEFAULT_THRESHOLD):
+    # A saved snapshot is a columnar read; only scrape when there is none, it covers
+    # fewer pages than asked for, or on refresh
+    store = get_snapshot_store()
+    records = store.load_records(company, role)
+    # Listing pages already crawled; recorded even when a crawl found nothing new
+    covered = get_watermark_store().depth("code360", company, role)
+    if refresh or not records or pages > covered:
+        # With a snapshot only experiences it doesn't hold yet are scraped, so the
+        # index update below embeds just that delta
+        df = fetch_interview_data(company, role, pages, incremental=bool(records), extend=pages > covered)
+        structured = list(iter_structured_rows(df, defaults={"company": company, "role": role})) if not df.empty else []
+        store.write_scrapes(df, company, role)
+        # Keep compact records around instead of dicts that hold each row's raw text
+        store.write_records(to_records(structured), company, role)
+        # New scrapes supersede their URLs' older rows; the rest of the snapshot is kept
+        records = store.load_records(company, role)
+    df = store.load_scrapes(company, role)
+    # Reposted or cross-listed experiences would only crowd the top-k results.
+    # Only the index is deduplicated; the catalog and analytics count every experience.
+    unique = dedupe_records(records, threshold=dedup_threshold, question_threshold=dedup_threshold)
+    chunks = json_to_documents(to_dicts(unique))
     embeddings = get_embeddings()
-    vectorstore = FAISS.from_documents(docs, embeddings)
-    return vectorstore, df, structured
+    # One shared index serves every company/role; reuse it when this corpus is already in it
+    index_store = get_index_store()
+    texts_hash = corpus_hash(chunks)
+    if index_store.load(company, role, embeddings, texts_hash, EMBEDDING_MODEL) is None:
+        # Only new or changed experiences are embedded into the saved index
+        docs = build_documents(chunks, unique, company, role)
+        index_store.update(company, role, docs, embeddings, texts_hash, EMBEDDING_MODEL)
+    retriever = index_store.retriever(embeddings, k=5, company=company, role=role)
+    return retriever, df, records
 
 # 🎯 Page Title
 st.markdown("""
@@ -134,6 +167,7 @@ with st.sidebar:
 company = st.text_input("Enter Company Name", "Microsoft")
 role = st.text_input("Enter Role", "SDE-2")
 pages = st.number_input("Number of Pages to Scrape", min_value=1, max_value=10, value=1)
+refresh = st.checkbox("Check for new interviews even if saved ones exist", value=False)
 
 #  Session state
 if "chat_history" not in st.session_state:
@@ -144,13 +178,19 @@ if "qa_chain" not in st.session_state:
 #  Load VectorStore + Build QA Chain
 if st.button("Load & Build Chatbot"):
     with st.spinner("Working...",show_time=True):
-        vs, df, structured = load_vectorstore(company, role, pages)
+        if refresh:
+            # A refresh must reach the scraper, and later loads must see what it found,
+            # so drop every memoized result instead of keying the cache on the flag
+            load_vectorstore.clear()
+        retriever, df, structured = load_vectorstore(company, role, pages, refresh)
         st.session_state.structured = structured
+        st.session_state.catalog = build_catalog(structured, aliases=load_aliases())
+        st.session_state.analytics = CorpusAnalytics(structured)
 
         custom_prompt = get_prompt()
         st.session_state.qa_chain = ConversationalRetrievalChain.from_llm(
             llm=get_llm(),
-            retriever=vs.as_retriever(search_kwargs={"k": 5}),
+            retriever=retriever,
             return_source_documents=True,
             combine_docs_chain_kwargs={"prompt": custom_prompt}
         )
@@ -166,11 +206,14 @@ if st.session_state.qa_chain:
             st.stop()
 
         with st.spinner("Thinking..."):
-            result = st.session_state.qa_chain({
-                "question": prompt,
-                "chat_history": st.session_state.chat_history
-            })
-            answer = result["answer"]
+            # Statistical prompts get exact answers from the loaded corpus, no LLM call
+            answer = route_query(prompt, st.session_state.get("analytics"), st.session_state.get("catalog"))
+            if answer is None:
+                result = st.session_state.qa_chain({
+                    "question": prompt,
+                    "chat_history": st.session_state.chat_history
+                })
+                answer = result["answer"]
             st.session_state.chat_history.append((prompt, answer))
 
             for user_q, bot_a in st.session_state.chat_history:
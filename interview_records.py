@@ -0,0 +1,128 @@
+import sys
+from dataclasses import dataclass
+
+# Top-level keys a structured interview dict may carry besides its content
+METADATA_KEYS = ("company", "role", "url")
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _strings(values):
+    return tuple(_intern(v) for v in values) if values else ()
+
+
+@dataclass(slots=True)
+class Question:
+    title: str
+    difficulty: str = None
+    approach: str = ""
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("title") or "", _intern(data.get("difficulty")), data.get("approach") or "")
+
+    def to_dict(self):
+        return {"title": self.title, "difficulty": self.difficulty, "approach": self.approach}
+
+
+@dataclass(slots=True)
+class Round:
+    round_number: int
+    mode: str = None
+    duration: str = None
+    type: str = None
+    questions: tuple = ()
+    links: tuple = None
+
+    @classmethod
+    def from_dict(cls, data):
+        links = data.get("links")
+        return cls(
+            data.get("round_number"),
+            _intern(data.get("mode")),
+            _intern(data.get("duration")),
+            _intern(data.get("type")),
+            tuple(Question.from_dict(q) for q in data.get("questions") or ()),
+            tuple(links) if links is not None else None,
+        )
+
+    def to_dict(self):
+        data = {
+            "round_number": self.round_number,
+            "mode": self.mode,
+            "duration": self.duration,
+            "type": self.type,
+            "questions": [q.to_dict() for q in self.questions],
+        }
+        if self.links is not None:
+            data["links"] = list(self.links)
+        return data
+
+
+@dataclass(slots=True)
+class Interview:
+    """
+    Compact form of one structured interview. Repeated values (difficulty,
+    topics, mode, company, role) are interned, and the raw source text is not
+    kept. Round links are already extracted at structuring time.
+    """
+    application_method: str = None
+    eligibility: str = None
+    preparation_duration: str = None
+    topics: tuple = None
+    tips: tuple = ()
+    resume_tips: tuple = ()
+    rounds: tuple = ()
+    company: str = None
+    role: str = None
+    url: str = None
+
+    @classmethod
+    def from_dict(cls, data):
+        topics = data.get("topics")
+        return cls(
+            data.get("application_method"),
+            data.get("eligibility"),
+            _intern(data.get("preparation_duration")),
+            _strings(topics) if topics is not None else None,
+            tuple(data.get("tips") or ()),
+            tuple(data.get("resume_tips") or ()),
+            tuple(Round.from_dict(r) for r in data.get("interview_rounds") or ()),
+            _intern(data.get("company")),
+            _intern(data.get("role")),
+            data.get("url"),
+        )
+
+    def to_dict(self):
+        """Dict in the shape produced by clean_and_structure (without 'raw')"""
+        data = {}
+        if self.application_method is not None:
+            data["application_method"] = self.application_method
+        if self.eligibility is not None:
+            data["eligibility"] = self.eligibility
+        if self.preparation_duration is not None:
+            data["preparation_duration"] = self.preparation_duration
+        if self.topics is not None:
+            data["topics"] = list(self.topics)
+        if self.tips:
+            data["tips"] = list(self.tips)
+        if self.resume_tips:
+            data["resume_tips"] = list(self.resume_tips)
+        data["interview_rounds"] = [r.to_dict() for r in self.rounds]
+        for key in METADATA_KEYS:
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        return data
+
+
+def to_records(structured):
+    """Structured interview dicts -> Interview records"""
+    return [Interview.from_dict(entry) for entry in structured]
+
+
+def to_dicts(records):
+    """Interview records -> dicts accepted by json_to_documents"""
+    return [record.to_dict() for record in records]
@@ -0,0 +1,111 @@
+import re
+import math
+from collections import Counter
+
+import numpy as np
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+RRF_K = 60                # reciprocal rank fusion damping constant
+LEXICAL_MAX_TERMS = 4     # short keyword queries at most this long skip the embedding call
+LEXICAL_MAX_DF = 0.2      # ... when every term occurs in at most this share of documents
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "asked", "for", "give", "in", "is", "me", "of", "on", "show",
+    "the", "to", "was", "what", "which", "with",
+}
+# Words that make a query a natural-language question rather than keywords
+QUESTION_WORDS = {
+    "can", "could", "do", "does", "explain", "how", "should", "tell", "why", "when", "where", "who", "would",
+}
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def query_terms(query):
+    return [term for term in tokenize(query) if term not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    In-memory BM25 over a list of texts. Postings are numpy arrays per term,
+    so scoring a query is a few vectorized adds over the matching documents.
+    Document ids are positions in the list, matching the FAISS positions the
+    texts were taken from.
+    """
+
+    def __init__(self, texts, k1=BM25_K1, b=BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.size = len(texts)
+        lengths = np.zeros(self.size, dtype=np.float32)
+        postings = {}
+        for position, text in enumerate(texts):
+            counts = Counter(tokenize(text))
+            lengths[position] = sum(counts.values())
+            for term, tf in counts.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(position)
+                postings[term][1].append(tf)
+        average = float(lengths.mean()) if self.size else 0.0
+        self._norm = k1 * (1 - b + b * lengths / average) if average else np.full(self.size, k1, dtype=np.float32)
+        self._postings = {
+            term: (np.asarray(docs, dtype=np.int64), np.asarray(tfs, dtype=np.float32))
+            for term, (docs, tfs) in postings.items()
+        }
+        self._df = {term: len(docs) for term, (docs, _) in postings.items()}
+        self._idf = {
+            term: math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+            for term, df in self._df.items()
+        }
+
+    def __contains__(self, term):
+        return term in self._postings
+
+    def document_frequency(self, term, positions=None):
+        """Documents containing `term`, counted among `positions` when given"""
+        if term not in self._postings:
+            return 0
+        if positions is None:
+            return self._df[term]
+        return int(np.isin(self._postings[term][0], positions, assume_unique=True).sum())
+
+    def is_lexical(self, query, positions=None):
+        """
+        Short keyword query whose terms are all rare in the corpus (or among
+        `positions`), e.g. 'LRU cache'. Questions ('tips for interview rounds',
+        'how long ...') use common or question words and are left to hybrid search.
+        """
+        terms = query_terms(query)
+        if not 0 < len(terms) <= LEXICAL_MAX_TERMS or QUESTION_WORDS.intersection(terms):
+            return False
+        size = self.size if positions is None else len(positions)
+        limit = max(LEXICAL_MAX_DF * size, 1)
+        return all(0 < self.document_frequency(term, positions) <= limit for term in terms)
+
+    def search(self, query, k, positions=None):
+        """[(position, score)] best first, limited to `positions` when given"""
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term in set(query_terms(query)):
+            if term not in self._postings:
+                continue
+            docs, tfs = self._postings[term]
+            scores[docs] += self._idf[term] * tfs * (self.k1 + 1) / (tfs + self._norm[docs])
+        candidates = positions if positions is not None else np.arange(self.size)
+        candidates = candidates[scores[candidates] > 0]
+        if not len(candidates):
+            return []
+        top = candidates[np.argsort(-scores[candidates], kind="stable")[:k]]
+        return [(int(position), float(scores[position])) for position in top]
+
+
+def reciprocal_rank_fusion(rankings, k, rrf_k=RRF_K):
+    """Fuse ranked position lists: score = sum of 1 / (rrf_k + rank) over the lists"""
+    fused = {}
+    for ranking in rankings:
+        for rank, position in enumerate(ranking, 1):
+            fused[position] = fused.get(position, 0.0) + 1.0 / (rrf_k + rank)
+    return sorted(fused, key=lambda position: -fused[position])[:k]
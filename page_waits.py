@@ -0,0 +1,110 @@
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+# Overall time one page may spend waiting across all of its waits
+DEFAULT_PAGE_DEADLINE = 20.0
+POLL_INTERVAL = 0.1
+
+
+class PageBudget:
+    """
+    Deadline shared by every wait on one page.
+    Each wait gets whatever time is left, and the time it actually took is
+    recorded under its label so callers can report real load times.
+    """
+
+    def __init__(self, deadline=DEFAULT_PAGE_DEADLINE):
+        self.deadline = deadline
+        self.start = time.monotonic()
+        self.timings = {}
+
+    def remaining(self):
+        return max(self.deadline - (time.monotonic() - self.start), 0.0)
+
+    def elapsed(self):
+        return time.monotonic() - self.start
+
+    def wait_for(self, driver, condition, label, timeout=None, optional=False):
+        """
+        Block until `condition` holds, the per-wait `timeout` passes or the page
+        deadline is hit. Optional waits return None on timeout instead of raising.
+        """
+        limit = self.remaining() if timeout is None else min(timeout, self.remaining())
+        started = time.monotonic()
+        try:
+            # Elements detached mid-poll by a re-render just mean "not yet"
+            return WebDriverWait(driver, max(limit, 0.01), poll_frequency=POLL_INTERVAL,
+                                 ignored_exceptions=(StaleElementReferenceException,)).until(condition)
+        except TimeoutException:
+            if not optional:
+                raise
+            return None
+        finally:
+            self.timings[label] = self.timings.get(label, 0.0) + time.monotonic() - started
+
+    def report(self):
+        parts = [f"{label} {secs:.2f}s" for label, secs in self.timings.items()]
+        return f"{self.elapsed():.2f}s total ({', '.join(parts)})" if parts else f"{self.elapsed():.2f}s total"
+
+
+def document_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def any_present(*locators):
+    """First element matching any of the locators"""
+    def _predicate(driver):
+        for locator in locators:
+            found = driver.find_elements(*locator)
+            if found:
+                return found[0]
+        return False
+    return _predicate
+
+
+def list_state(driver, locator):
+    """(count, first text) of the elements matching `locator`, None if absent or detached"""
+    found = driver.find_elements(*locator)
+    try:
+        return (len(found), found[0].text) if found else None
+    except StaleElementReferenceException:
+        return None
+
+
+def changed(locator, before):
+    """
+    The list matching `locator` differs from the `before` snapshot (see
+    list_state), i.e. a search typed into its input has been applied.
+    """
+    def _predicate(driver):
+        state = list_state(driver, locator)
+        return state is not None and state != before
+    return _predicate
+
+
+def settled(locator, quiet=0.3):
+    """
+    Elements matching `locator` exist and their count and first text have not
+    changed for `quiet` seconds, i.e. a filtered list has finished re-rendering.
+    """
+    state = {"snapshot": None, "since": 0.0}
+
+    def _predicate(driver):
+        snapshot = list_state(driver, locator)
+        if snapshot is None:
+            # Missing or detached while re-rendering: the list is still changing
+            state["snapshot"] = None
+            return False
+        now = time.monotonic()
+        if snapshot != state["snapshot"]:
+            state["snapshot"], state["since"] = snapshot, now
+            return False
+        return driver.find_elements(*locator) if now - state["since"] >= quiet else False
+    return _predicate
+
+
+def replaced(element):
+    """The given element was detached, i.e. the list it belonged to re-rendered"""
+    return EC.staleness_of(element)
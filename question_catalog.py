@@ -0,0 +1,136 @@
+import os
+import json
+import difflib
+from collections import Counter
+
+from dedup import normalize_title
+from scrape_cache import normalize_key
+
+# Optional JSON alias table {alias title: canonical title}
+ALIASES_PATH = os.environ.get("PREPGENIE_QUESTION_ALIASES")
+FUZZY_CUTOFF = 0.9  # difflib ratio needed to merge a title into an existing problem
+
+NUMBER_WORDS = {
+    "0": "zero", "1": "one", "2": "two", "3": "three", "4": "four",
+    "5": "five", "6": "six", "7": "seven", "8": "eight", "9": "nine",
+}
+FILLER_WORDS = {"a", "an", "the", "problem", "question", "program", "leetcode", "lc"}
+
+
+def canonical_key(title: str) -> str:
+    """'2 Sum problem' and 'Two sum' both become 'two sum'"""
+    words = (NUMBER_WORDS.get(word, word) for word in normalize_title(title).split())
+    return " ".join(word for word in words if word not in FILLER_WORDS)
+
+
+def problem_id(key: str) -> str:
+    return key.replace(" ", "-")
+
+
+def load_aliases(path=ALIASES_PATH):
+    """Alias table from a JSON object of {alias title: canonical title}; {} when not configured"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class QuestionCatalog:
+    """
+    Maps free-text question titles to canonical problem IDs and keeps an
+    inverted index problem -> occurrences (company, role, round, difficulty,
+    url). Titles are matched by alias table first, then by normalized key,
+    then fuzzily against the problems already known.
+    """
+
+    def __init__(self, aliases=None, cutoff=FUZZY_CUTOFF):
+        self.cutoff = cutoff
+        self.aliases = {canonical_key(alias): canonical_key(target) for alias, target in (aliases or {}).items()}
+        self.titles = {}      # problem id -> first title seen
+        self.postings = {}    # problem id -> [(company, role, round_number, difficulty, url)]
+        self._resolved = {}   # canonical key -> problem id
+        self._blocks = {}     # first/last word -> problem keys, the fuzzy match candidates
+        self._by_company = {}  # normalized company -> Counter(problem id)
+
+    def canonical_id(self, title, add=False):
+        """Problem ID for `title`, or None if unknown and `add` is False"""
+        key = canonical_key(title)
+        if not key:
+            return None
+        key = self.aliases.get(key, key)
+        if key in self._resolved:
+            return self._resolved[key]
+        words = key.split()
+        candidates = set(self._blocks.get(words[0], ())) | set(self._blocks.get(words[-1], ()))
+        close = difflib.get_close_matches(key, candidates, n=1, cutoff=self.cutoff)
+        if close:
+            pid = self._resolved[close[0]]
+        elif add:
+            pid = problem_id(key)
+            self.titles[pid] = title.strip()
+            self.postings[pid] = []
+            for word in {words[0], words[-1]}:
+                self._blocks.setdefault(word, []).append(key)
+        else:
+            return None
+        self._resolved[key] = pid
+        return pid
+
+    def add_record(self, record):
+        """Index every question of one Interview record"""
+        company_key = normalize_key(record.company) if record.company else None
+        for r in record.rounds:
+            for q in r.questions:
+                pid = self.canonical_id(q.title, add=True)
+                if pid is None:
+                    continue
+                self.postings[pid].append((record.company, record.role, r.round_number, q.difficulty, record.url))
+                if company_key:
+                    self._by_company.setdefault(company_key, Counter())[pid] += 1
+
+    def problem(self, pid):
+        """Title, frequency and the companies/roles/rounds/difficulties a problem was asked in"""
+        postings = self.postings.get(pid, [])
+        return {
+            "id": pid,
+            "title": self.titles.get(pid),
+            "frequency": len(postings),
+            "companies": Counter(p[0] for p in postings if p[0]),
+            "roles": Counter(p[1] for p in postings if p[1]),
+            "rounds": Counter(p[2] for p in postings if p[2] is not None),
+            "difficulty": Counter(p[3] for p in postings if p[3]),
+        }
+
+    def most_asked(self, company=None, role=None, round_number=None, limit=10):
+        """[(problem id, title, count)] most frequent first"""
+        if role is None and round_number is None:
+            if company is None:
+                counts = Counter({pid: len(postings) for pid, postings in self.postings.items()})
+            else:
+                counts = self._by_company.get(normalize_key(company), Counter())
+        else:
+            company_key = normalize_key(company) if company else None
+            role_key = normalize_key(role) if role else None
+            counts = Counter()
+            for pid, postings in self.postings.items():
+                for p_company, p_role, p_round, _, _ in postings:
+                    if company_key and (not p_company or normalize_key(p_company) != company_key):
+                        continue
+                    if role_key and (not p_role or normalize_key(p_role) != role_key):
+                        continue
+                    if round_number is not None and p_round != round_number:
+                        continue
+                    counts[pid] += 1
+        return [(pid, self.titles[pid], count) for pid, count in counts.most_common(limit)]
+
+    def lookup(self, title):
+        """problem() for a free-text title, or None if it matches nothing"""
+        pid = self.canonical_id(title)
+        return self.problem(pid) if pid else None
+
+
+def build_catalog(records, aliases=None, cutoff=FUZZY_CUTOFF):
+    catalog = QuestionCatalog(aliases, cutoff)
+    for record in records:
+        catalog.add_record(record)
+    return catalog
@@ -0,0 +1,146 @@
+import os
+import time
+import json
+import hashlib
+import sqlite3
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+CACHE_PATH = os.environ.get("PREPGENIE_CACHE_PATH", os.path.join(".cache", "prepgenie.sqlite3"))
+DEFAULT_TTL = 7 * 24 * 3600          # seconds before a cached page is re-scraped
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # total text kept before LRU eviction
+
+TRACKING_PARAMS = ("utm_", "ref", "fbclid", "gclid")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical cache key for a URL: lowercase scheme/host, no fragment,
+    no trailing slash, tracking params dropped and the query sorted.
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PARAMS)
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ""))
+
+
+def normalize_key(value: str) -> str:
+    """Case- and whitespace-insensitive form of a company/role name"""
+    return " ".join(str(value).split()).lower()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ScrapeCache:
+    """
+    SQLite-backed cache of extracted page text, keyed by (kind, normalized URL).
+    `kind` separates the scrapers so each one gets back exactly what it stored.
+    Entries expire after `ttl` seconds; when the stored text exceeds
+    `max_bytes` the least recently used entries are evicted.
+    """
+
+    def __init__(self, path=CACHE_PATH, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS scrape_cache (
+                kind TEXT NOT NULL,
+                url TEXT NOT NULL,
+                text TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (kind, url)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS scrape_cache_lru ON scrape_cache (accessed_at)")
+        self._conn.commit()
+
+    def get(self, url, kind="text"):
+        """Cached text for `url`, or None if missing or older than the TTL"""
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, fetched_at FROM scrape_cache WHERE kind = ? AND url = ?", (kind, key)
+            ).fetchone()
+            if row is None:
+                return None
+            if self.ttl is not None and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM scrape_cache WHERE kind = ? AND url = ?", (kind, key))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE scrape_cache SET accessed_at = ? WHERE kind = ? AND url = ?", (now, kind, key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def put(self, url, text, kind="text"):
+        """Store extracted text for `url` and evict old entries if over budget"""
+        key = normalize_url(url)
+        now = time.time()
+        size = len(text.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scrape_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, key, text, content_hash(text), size, now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def get_json(self, url, kind):
+        text = self.get(url, kind)
+        return json.loads(text) if text is not None else None
+
+    def put_json(self, url, value, kind):
+        self.put(url, json.dumps(value, ensure_ascii=False), kind)
+
+    def _evict_locked(self):
+        if self.ttl is not None:
+            self._conn.execute("DELETE FROM scrape_cache WHERE fetched_at < ?", (time.time() - self.ttl,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM scrape_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT kind, url, size FROM scrape_cache ORDER BY accessed_at")
+        doomed = []
+        for kind, url, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((kind, url))
+            total -= size
+        self._conn.executemany("DELETE FROM scrape_cache WHERE kind = ? AND url = ?", doomed)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM scrape_cache")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_scrape_cache():
+    """Process-wide cache shared by all scrapers"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ScrapeCache()
+        return _cache
@@ -4,8 +4,28 @@ import re
 import pandas as pd
 import requests
 import time
+import asyncio
+import threading
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from scrape_cache import get_scrape_cache
+from telemetry import ScrapeTelemetry, get_telemetry
 
 BASE_URL = "https://www.geeksforgeeks.org/interview-experiences/experienced-interview-experiences-company-wise/"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+}
+
+# Politeness limits for the asyncio mode: sustained requests/second and burst per host
+ASYNC_RATE_PER_HOST = 4.0
+ASYNC_BURST = 4
+ASYNC_MAX_CONCURRENCY = 8
+
+# Pause between network fetches in the one-by-one mode
+SYNC_FETCH_DELAY = 2.0
+
+# How long the parsed company listing is trusted before revalidating it
+COMPANY_INDEX_TTL = 6 * 3600
 
 def infer_role_and_years(title):
     m = re.search(r'(\d+(\.\d+)?)\s*(?:yr|year)', title, re.IGNORECASE)
@@ -18,117 +38,313 @@ def infer_role_and_years(title):
         role = "SDE-3"
     return yrs, role
 
+# A company heading such as "Amazon :", "J.P. Morgan :" or "AT&T :": a short
+# line of name characters ending in a colon, outside any link
+COMPANY_LABEL_RE = re.compile(r"^\s*[A-Za-z0-9][\w .&'+()/,-]{0,60}?\s*:$")
+
+
+def _company_key(label: str) -> str:
+    return " ".join(label.strip().rstrip(":").split()).lower()
+
+
+def build_company_index(page_html) -> dict:
+    """
+    Parse the company-wise listing page in one pass into
+    {company key: [(title, link, years, role), ...]}.
+    """
+    soup = BeautifulSoup(page_html, "lxml")
+    index = {}
+    current = None
+    for elem in soup.descendants:
+        if (isinstance(elem, NavigableString) and COMPANY_LABEL_RE.match(elem.strip())
+                and elem.find_parent("a") is None):
+            current = index.setdefault(_company_key(elem), [])
+        elif current is not None and isinstance(elem, Tag) and elem.name == "a" and elem.get("href"):
+            title = elem.get_text(strip=True)
+            yrs, role = infer_role_and_years(title)
+            current.append((title, elem["href"], yrs, role))
+    return index
+
+
+class CompanyIndex:
+    """
+    Cached company -> experiences index for the listing page.
+    The page is downloaded and parsed at most once per `ttl`; after that it is
+    revalidated with a conditional GET and only re-parsed when it changed.
+    """
+
+    def __init__(self, url=BASE_URL, ttl=COMPANY_INDEX_TTL):
+        self.url = url
+        self.ttl = ttl
+        self.companies = None
+        self.fetched_at = 0.0
+        self.etag = None
+        self.last_modified = None
+        self._lock = threading.Lock()
+
+    def get(self) -> dict:
+        with self._lock:
+            if self.companies is not None and time.time() - self.fetched_at < self.ttl:
+                return self.companies
+
+            headers = dict(HEADERS)
+            if self.companies is not None:
+                if self.etag:
+                    headers["If-None-Match"] = self.etag
+                if self.last_modified:
+                    headers["If-Modified-Since"] = self.last_modified
+
+            resp = requests.get(self.url, headers=headers, timeout=30)
+            if resp.status_code == 304 and self.companies is not None:
+                self.fetched_at = time.time()
+                return self.companies
+            resp.raise_for_status()
+
+            self.companies = build_company_index(resp.text)
+            self.fetched_at = time.time()
+            self.etag = resp.headers.get("ETag")
+            self.last_modified = resp.headers.get("Last-Modified")
+            return self.companies
+
+    def lookup(self, company: str):
+        return self.get().get(_company_key(company))
+
+
+_company_index = CompanyIndex()
+
+
+def _entries_df(company, entries):
+    return pd.DataFrame([
+        {"Company": company.capitalize(), "Title": title, "Link": link, "Years": yrs, "Role": role}
+        for title, link, yrs, role in entries
+    ])
+
+
 def get_company_interview_df(company: str) -> pd.DataFrame:
     """
     Scrape GeeksforGeeks interview experiences for a specific company
     and return a pandas DataFrame with Title, Link, Years, and Role.
+    The listing page is parsed once into a cached index shared by all lookups.
     """
-    resp = requests.get(BASE_URL)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "lxml")
+    entries = _company_index.lookup(company)
 
-    company_label = company.strip().capitalize() + " :"
-    company_node = soup.find(string=re.compile(f'^{re.escape(company_label)}$', re.IGNORECASE))
-
-    if not company_node:
+    if entries is None:
         print(f"❌ Company '{company}' not found.")
         return pd.DataFrame()
 
-    entries = []
-    for elem in company_node.next_elements:
-        if isinstance(elem, NavigableString) and re.match(r'^\s*[A-Za-z0-9 &]+\s*:$', elem.strip()) \
-           and elem.strip().lower() != company_label.lower():
-            break
+    return _entries_df(company, entries)
 
-        if isinstance(elem, Tag) and elem.name == "a" and elem.get("href"):
-            title = elem.get_text(strip=True)
-            link = elem["href"]
-            yrs, role = infer_role_and_years(title)
-            entries.append({
-                "Company": company.capitalize(),
-                "Title": title,
-                "Link": link,
-                "Years": yrs,
-                "Role": role
-            })
 
-    return pd.DataFrame(entries)
+def get_companies_interview_df(companies) -> pd.DataFrame:
+    """Batch lookup for several companies sharing one listing download"""
+    frames = []
+    for company in companies:
+        entries = _company_index.lookup(company)
+        if entries is None:
+            print(f"❌ Company '{company}' not found.")
+            continue
+        frames.append(_entries_df(company, entries))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def parse_full_text(page_html):
+    """Extract the round-wise experience text from a GFG article page"""
+    soup = BeautifulSoup(page_html, "html.parser")
+    text_div = soup.find("div", class_="text") or \
+               soup.find("div", class_="entry-content") or \
+               soup.find("article") or \
+               soup.find("div", class_="content") or \
+               soup.body
+
+    if not text_div:
+        return "Content div not found"
+
+    full_experience = []
+    strong_tags = text_div.find_all('strong')
+
+    if not strong_tags:
+        clean_text = text_div.get_text(separator=' ', strip=True)
+        return re.sub(r'\s+', ' ', clean_text)
+
+    for i, strong in enumerate(strong_tags):
+        round_title = strong.get_text(strip=True)
+        round_keywords = ['round', 'interview', 'telephonic', 'f2f', 'phone', 'onsite',
+                          'technical', 'hr', 'managerial', 'written', 'coding', 'design',
+                          'screening', 'assessment', 'test']
 
+        if not any(keyword in round_title.lower() for keyword in round_keywords):
+            if not re.match(r'.*round\s*\d+', round_title.lower()):
+                continue
+
+        content_parts = []
+        current = strong.next_sibling
+
+        while current:
+            if hasattr(current, 'name') and current.name == 'strong':
+                next_strong_text = current.get_text(strip=True)
+                if any(keyword in next_strong_text.lower() for keyword in round_keywords) or \
+                   re.match(r'.*round\s*\d+', next_strong_text.lower()):
+                    break
+
+            if isinstance(current, str):
+                content_parts.append(current)
+            else:
+                content_parts.append(str(current))
+
+            current = current.next_sibling
+
+        round_content = ''.join(content_parts).strip()
+        round_content = re.sub(r'\s+', ' ', round_content)
+        round_content = re.sub(r'<!--.*?-->', '', round_content, flags=re.DOTALL)
+        round_content = re.sub(r'</?div[^>]*>', '', round_content)
+
+        if round_content:
+            full_experience.append(f"<h3>{round_title}</h3>\n{round_content}\n")
+
+    result = '\n'.join(full_experience) if full_experience else text_div.get_text(separator=' ', strip=True)
+    return re.sub(r'\n\s*\n\s*\n+', '\n\n', result.strip())
+
+
+def clean_experience_text(text):
+    """Strip leftover markup from fetch_full_text output"""
+    return BeautifulSoup(str(text), "html.parser").get_text(separator=' ', strip=True)
+
+
+def fetch_full_text(link, session=None, use_cache=True, telemetry=None, throttle=None):
+    """
+    Round-wise experience text of one GFG article, served from the scrape
+    cache when possible. `throttle` is called right before a network fetch,
+    so rate limits never delay cache hits.
+    """
+    with (telemetry or get_telemetry()).span(link, "gfg") as span:
+        cache = get_scrape_cache() if use_cache else None
+        if cache is not None:
+            with span.phase("cache"):
+                cached = cache.get(link, kind="gfg")
+            if cached:
+                span.status = "cached"
+                span.record_text(cached)
+                return cached
+
+        try:
+            if throttle is not None:
+                with span.phase("throttle"):
+                    throttle()
+            with span.phase("navigation"):
+                resp = (session or requests).get(link, headers=HEADERS, timeout=30)
+                resp.raise_for_status()
+            with span.phase("extraction"):
+                text = parse_full_text(resp.text)
+            span.record_text(text)
+            if cache is not None and text and text != "Content div not found":
+                cache.put(link, text, kind="gfg")
+            return text
+
+        except requests.RequestException as e:
+            span.status = "error"
+            return f"Network error: {str(e)}"
+        except Exception as e:
+            span.status = "error"
+            return f"Parsing error: {str(e)}"
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, holding at most `capacity`"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def make_session(pool_size=ASYNC_MAX_CONCURRENCY):
+    """requests.Session with a keep-alive connection pool large enough for the workers"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+
+async def fetch_full_texts_async(links, rate_per_host=ASYNC_RATE_PER_HOST, burst=ASYNC_BURST,
+                                 max_concurrency=ASYNC_MAX_CONCURRENCY, clean=True, telemetry=None):
+    """
+    Fetch and parse many links concurrently.
+    Each host gets its own token bucket so politeness limits still hold, while
+    network waits, HTML parsing and the post-cleaning step overlap across links.
+    Results come back in the order of `links`. Cached links skip the buckets.
+    """
+    buckets = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+    session = make_session(max_concurrency)
+    loop = asyncio.get_running_loop()
+
+    def work(link, bucket):
+        # Runs in a worker thread; a token is only taken when the page is actually fetched
+        def throttle():
+            asyncio.run_coroutine_threadsafe(bucket.acquire(), loop).result()
+        content = fetch_full_text(link, session=session, telemetry=telemetry, throttle=throttle)
+        return clean_experience_text(content) if clean else content
+
+    async def one(link):
+        host = urlsplit(link).netloc
+        bucket = buckets.setdefault(host, TokenBucket(rate_per_host, burst))
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(work, link, bucket)
+            except Exception as e:
+                return f"Unexpected error: {str(e)}"
 
-def fetch_full_text(link):
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-        }
-        resp = requests.get(link, headers=headers, timeout=30)
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        text_div = soup.find("div", class_="text") or \
-                   soup.find("div", class_="entry-content") or \
-                   soup.find("article") or \
-                   soup.find("div", class_="content") or \
-                   soup.body
-
-        if not text_div:
-            return "Content div not found"
-
-        full_experience = []
-        strong_tags = text_div.find_all('strong')
-
-        if not strong_tags:
-            clean_text = text_div.get_text(separator=' ', strip=True)
-            return re.sub(r'\s+', ' ', clean_text)
-
-        for i, strong in enumerate(strong_tags):
-            round_title = strong.get_text(strip=True)
-            round_keywords = ['round', 'interview', 'telephonic', 'f2f', 'phone', 'onsite',
-                              'technical', 'hr', 'managerial', 'written', 'coding', 'design',
-                              'screening', 'assessment', 'test']
-
-            if not any(keyword in round_title.lower() for keyword in round_keywords):
-                if not re.match(r'.*round\s*\d+', round_title.lower()):
-                    continue
-
-            content_parts = []
-            current = strong.next_sibling
-
-            while current:
-                if hasattr(current, 'name') and current.name == 'strong':
-                    next_strong_text = current.get_text(strip=True)
-                    if any(keyword in next_strong_text.lower() for keyword in round_keywords) or \
-                       re.match(r'.*round\s*\d+', next_strong_text.lower()):
-                        break
-
-                if isinstance(current, str):
-                    content_parts.append(current)
-                else:
-                    content_parts.append(str(current))
-
-                current = current.next_sibling
-
-            round_content = ''.join(content_parts).strip()
-            round_content = re.sub(r'\s+', ' ', round_content)
-            round_content = re.sub(r'<!--.*?-->', '', round_content, flags=re.DOTALL)
-            round_content = re.sub(r'</?div[^>]*>', '', round_content)
-
-            if round_content:
-                full_experience.append(f"<h3>{round_title}</h3>\n{round_content}\n")
-
-        result = '\n'.join(full_experience) if full_experience else text_div.get_text(separator=' ', strip=True)
-        return re.sub(r'\n\s*\n\s*\n+', '\n\n', result.strip())
-
-    except requests.RequestException as e:
-        return f"Network error: {str(e)}"
-    except Exception as e:
-        return f"Parsing error: {str(e)}"
-
-
-def add_interview_experiences(df: pd.DataFrame) -> pd.DataFrame:
+        return await asyncio.gather(*(one(link) for link in links))
+    finally:
+        session.close()
+
+
+def fetch_full_texts(links, **kwargs):
+    """Synchronous wrapper around fetch_full_texts_async"""
+    return asyncio.run(fetch_full_texts_async(list(links), **kwargs))
+
+
+def add_interview_experiences(df: pd.DataFrame, concurrent: bool = False, **async_kwargs) -> pd.DataFrame:
     """
     Given a DataFrame with a 'Link' column, scrape each URL
     and add an 'Interview_Experience' column.
+    With concurrent=True the links are fetched through the rate-limited
+    asyncio mode (see fetch_full_texts_async) instead of one by one.
     """
+    telemetry = ScrapeTelemetry()
+    if concurrent:
+        print(f"Fetching {len(df)} experiences concurrently...")
+        df = df.copy()
+        df["Interview_Experience"] = fetch_full_texts([row.get("Link", "") for _, row in df.iterrows()],
+                                                      telemetry=telemetry, **async_kwargs)
+        print(telemetry.report())
+        return df
+
+    last_fetch = None
+
+    def polite():
+        # Be polite to the server: space out network fetches, not cache hits
+        nonlocal last_fetch
+        if last_fetch is not None:
+            time.sleep(max(SYNC_FETCH_DELAY - (time.monotonic() - last_fetch), 0.0))
+        last_fetch = time.monotonic()
+
     experiences = []
     for idx, row in df.iterrows():
         link = row.get("Link", "")
@@ -136,9 +352,7 @@ def add_interview_experiences(df: pd.DataFrame) -> pd.DataFrame:
         print(f"Fetching ({idx+1}/{len(df)}): {title[:50]}...")
 
         try:
-            if idx > 0:
-                time.sleep(2)  # Be polite to the server
-            content = fetch_full_text(link)
+            content = fetch_full_text(link, telemetry=telemetry, throttle=polite)
         except Exception as e:
             content = f"Unexpected error: {str(e)}"
 
@@ -146,7 +360,6 @@ def add_interview_experiences(df: pd.DataFrame) -> pd.DataFrame:
 
     df = df.copy()
     df["Interview_Experience"] = experiences
-    df["Interview_Experience"] = df["Interview_Experience"].astype(str).apply(
-    lambda x: BeautifulSoup(x, "html.parser").get_text(separator=' ', strip=True)
-)
+    df["Interview_Experience"] = df["Interview_Experience"].astype(str).apply(clean_experience_text)
+    print(telemetry.report())
     return df
@@ -1,18 +1,34 @@
 import pandas as pd
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from experience_parser import extract_with_driver, fetch_experience
+from scrape_cache import get_scrape_cache
+from watermarks import get_watermark_store, is_known
+from telemetry import ScrapeTelemetry, get_telemetry
+from page_waits import (DEFAULT_PAGE_DEADLINE, PageBudget, any_present, changed, list_state,
+                        replaced, settled)
 
-def fetch_interview_links(company_to_filter, role_to_filter, pages_to_scrape):
+CARD_LOCATOR = (By.TAG_NAME, "codingninjas-interview-experience-card-v2")
+# Caps for optional waits on list re-renders and pagination links
+FILTER_RERENDER_TIMEOUT = 5
+NEXT_PAGE_TIMEOUT = 10
+
+def iter_interview_links(company_to_filter, role_to_filter, pages_to_scrape, known=None,
+                         page_deadline=DEFAULT_PAGE_DEADLINE):
     """
     Opens a browser, filters for company and role, and collects interview links.
-    Returns a list of dictionaries, e.g., [{'title': '...', 'url': '...'}].
+    Yields one list of dictionaries per results page, e.g., [{'title': '...', 'url': '...'}],
+    so detail scraping can start while later pages are still being paginated.
+    With `known` (normalized URLs already ingested) only new links are returned
+    and pagination stops at the first page without anything new.
+    Every wait is condition-based and bounded by `page_deadline` seconds per page
+    (the landing load and each filter step count as their own page).
     """
     print("--- Step 1: Fetching interview links ---")
     target_url = "https://www.naukri.com/code360/interview-experiences"
@@ -22,52 +38,88 @@ def fetch_interview_links(company_to_filter, role_to_filter, pages_to_scrape):
     options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
     
     driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    wait = WebDriverWait(driver, 15)
-    all_results = []
+    total_links = 0
 
     try:
+        # The landing load and each filter step get their own deadline, so a
+        # slow first load does not eat into the time the filters have
+        budget = PageBudget(page_deadline)
         driver.get(target_url)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "codingninjas-interview-experience-card-v2")))
+        budget.wait_for(driver, EC.presence_of_element_located(CARD_LOCATOR), "cards")
+        print(f"Landing page ready in {budget.report()}")
 
         # --- Company Filter ---
         print(f"Filtering for company: {company_to_filter}...")
-        wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#right-section-container codingninjas-ie-company-dropdown-widget > div"))).click()
-        comp_input = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[placeholder='Search']")))
+        budget = PageBudget(page_deadline)
+        company_options = (By.CSS_SELECTOR, "mat-radio-button.mat-radio-button")
+        budget.wait_for(driver, EC.element_to_be_clickable((By.CSS_SELECTOR, "#right-section-container codingninjas-ie-company-dropdown-widget > div")), "company dropdown").click()
+        comp_input = budget.wait_for(driver, EC.element_to_be_clickable((By.CSS_SELECTOR, "input[placeholder='Search']")), "company dropdown")
+        before = list_state(driver, company_options)
         comp_input.send_keys(company_to_filter)
-        time.sleep(2)
-        wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "mat-radio-button.mat-radio-button"))).click()
-        time.sleep(1)
+        # Let the debounced search replace the unfiltered list before judging it stable
+        budget.wait_for(driver, changed(company_options, before), "company search", timeout=FILTER_RERENDER_TIMEOUT, optional=True)
+        budget.wait_for(driver, settled(company_options), "company options")
+        first_card = driver.find_element(*CARD_LOCATOR)
+        budget.wait_for(driver, EC.element_to_be_clickable(company_options), "company options").click()
+        budget.wait_for(driver, replaced(first_card), "company results", timeout=FILTER_RERENDER_TIMEOUT, optional=True)
+        print(f"Company filter applied in {budget.report()}")
 
         # --- Role Filter ---
         print(f"Filtering for role: {role_to_filter}...")
-        wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#right-section-container codingninjas-ie-roles-dropdown-widget:nth-child(2) > div"))).click()
-        role_input = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "codingninjas-ie-roles-dropdown-widget input[placeholder='Search']")))
+        budget = PageBudget(page_deadline)
+        role_options = (By.CSS_SELECTOR, "codingninjas-ie-roles-dropdown-widget mat-checkbox")
+        budget.wait_for(driver, EC.element_to_be_clickable((By.CSS_SELECTOR, "#right-section-container codingninjas-ie-roles-dropdown-widget:nth-child(2) > div")), "role dropdown").click()
+        role_input = budget.wait_for(driver, EC.element_to_be_clickable((By.CSS_SELECTOR, "codingninjas-ie-roles-dropdown-widget input[placeholder='Search']")), "role dropdown")
+        before = list_state(driver, role_options)
         role_input.send_keys(role_to_filter)
-        time.sleep(2)
-        wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "codingninjas-ie-roles-dropdown-widget mat-checkbox"))).click()
-        time.sleep(1)
+        budget.wait_for(driver, changed(role_options, before), "role search", timeout=FILTER_RERENDER_TIMEOUT, optional=True)
+        budget.wait_for(driver, settled(role_options), "role options")
+        first_card = budget.wait_for(driver, EC.presence_of_element_located(CARD_LOCATOR), "cards")
+        budget.wait_for(driver, EC.element_to_be_clickable(role_options), "role options").click()
+        print(f"Role filter applied in {budget.report()}")
 
         # --- Pagination and Link Collection ---
         for page in range(1, pages_to_scrape + 1):
             print(f"Collecting links from page {page}...")
-            time.sleep(2)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.interview-experiences-list-section.ng-star-inserted")))
+            budget = PageBudget(page_deadline)
+            # Wait for the previous card list to be replaced, then for the new one to settle
+            if first_card is not None:
+                budget.wait_for(driver, replaced(first_card), "re-render", timeout=FILTER_RERENDER_TIMEOUT, optional=True)
+            budget.wait_for(driver, EC.presence_of_element_located((By.CSS_SELECTOR, "div.interview-experiences-list-section.ng-star-inserted")), "list")
+            budget.wait_for(driver, settled(CARD_LOCATOR), "cards")
+            print(f"  Page {page} ready in {budget.report()}")
             cards = driver.find_elements(By.TAG_NAME, "codingninjas-interview-experience-card-v2")
+            page_results = []
+            page_links = 0
+            new_links = 0
             for card in cards:
                 try:
                     anchor = card.find_element(By.CSS_SELECTOR, "a.interview-exp-title")
                     href = anchor.get_attribute("href")
                     text = anchor.text.strip()
                     if href and text:
-                        all_results.append({"title": text, "url": href})
+                        page_links += 1
+                        if known is None or not is_known(href, known):
+                            page_results.append({"title": text, "url": href})
+                            new_links += 1
                 except NoSuchElementException:
                     continue
             
+            if known is not None and page_links and not new_links:
+                print(f"Page {page} only has already-ingested links. Stopping link collection.")
+                break
+            
+            # Capture the stale marker before handing the page out
+            first_card = cards[0] if cards else None
+            if page_results:
+                total_links += len(page_results)
+                yield page_results
+            
             if page >= pages_to_scrape:
                 break
             
             try:
-                next_page_link = wait.until(EC.element_to_be_clickable((By.XPATH, f"//codingninjas-page-nav-v2//a[normalize-space(text())='{page + 1}']")))
+                next_page_link = budget.wait_for(driver, EC.element_to_be_clickable((By.XPATH, f"//codingninjas-page-nav-v2//a[normalize-space(text())='{page + 1}']")), "next page", timeout=NEXT_PAGE_TIMEOUT)
                 driver.execute_script("arguments[0].click();", next_page_link)
             except TimeoutException:
                 print(f"Could not find link for page {page + 1}. Stopping link collection.")
@@ -77,13 +129,58 @@ def fetch_interview_links(company_to_filter, role_to_filter, pages_to_scrape):
         print(f"An error occurred while fetching links: {e}")
     finally:
         driver.quit()
-        print(f"Found {len(all_results)} links to scrape.")
-        return all_results
+        print(f"Found {total_links} links to scrape.")
+
+def fetch_interview_links(company_to_filter, role_to_filter, pages_to_scrape, known=None,
+                          page_deadline=DEFAULT_PAGE_DEADLINE):
+    """
+    Collects every interview link up front.
+    Returns a list of dictionaries, e.g., [{'title': '...', 'url': '...'}].
+    """
+    return [
+        item
+        for page_results in iter_interview_links(company_to_filter, role_to_filter, pages_to_scrape,
+                                                 known=known, page_deadline=page_deadline)
+        for item in page_results
+    ]
+
+def scrape_interview_details(url, fast_path=True, use_cache=True, telemetry=None):
+    """
+    Cached wrapper around _scrape_interview_details: repeat requests for the
+    same URL are served from the on-disk scrape cache.
+    """
+    with (telemetry or get_telemetry()).span(url, "code360-details") as span:
+        cache = get_scrape_cache() if use_cache else None
+        if cache is not None:
+            with span.phase("cache"):
+                cached = cache.get(url, kind="code360-details")
+            if cached:
+                span.status = "cached"
+                span.record_text(cached)
+                return cached
 
-def scrape_interview_details(url):
+        description = _scrape_interview_details(url, span, fast_path)
+        if not description:
+            span.status = "failed" if span.status == "ok" else span.status
+            return description
+        span.record_text(description)
+        if cache is not None:
+            cache.put(url, description, kind="code360-details")
+        return description
+
+def _scrape_interview_details(url, span, fast_path=True, page_deadline=DEFAULT_PAGE_DEADLINE):
     """
     Scrapes BOTH the overall journey and the detailed, numbered rounds from a single URL.
+    Tries the browser-free HTTP fast path first and only starts Chrome when the
+    server-rendered page lacks the journey/round containers.
     """
+    if fast_path:
+        with span.phase("fast_path"):
+            details = fetch_experience(url)
+        if details:
+            return details["description"]
+        span.retries += 1
+
     driver = None
     try:
         options = webdriver.ChromeOptions()
@@ -91,66 +188,70 @@ def scrape_interview_details(url):
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--log-level=3')
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        with span.phase("acquire"):
+            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
 
-        driver.get(url)
-        time.sleep(7)
-
-        description_parts = []
         # Selectors
         JOURNEY_SELECTOR = "#ie-overall-user-experience"
-        CONTINUE_READING_BUTTON_SELECTOR = "#continue-reading-ie-cta-container button"
         ROUND_CONTAINER_BASE_ID = "interview-round-v2-"
+        FALLBACK_SELECTOR = "div.blog-body-content"
+
+        budget = PageBudget(page_deadline)
+        with span.phase("navigation"):
+            driver.get(url)
+        # Wait until any content container has rendered instead of a fixed delay
+        with span.phase("wait"):
+            budget.wait_for(driver, any_present(
+                (By.ID, f"{ROUND_CONTAINER_BASE_ID}1"),
+                (By.CSS_SELECTOR, JOURNEY_SELECTOR),
+                (By.CSS_SELECTOR, FALLBACK_SELECTOR),
+            ), "content", optional=True)
         
-        # --- Scrape Journey ---
-        try:
-            try:
-                continue_button = driver.find_element(By.CSS_SELECTOR, CONTINUE_READING_BUTTON_SELECTOR)
-                driver.execute_script("arguments[0].click();", continue_button)
-                time.sleep(1)
-            except NoSuchElementException:
-                pass
-            journey_element = driver.find_element(By.CSS_SELECTOR, JOURNEY_SELECTOR)
-            description_parts.append("## Interview Preparation Journey\n" + journey_element.text.strip())
-        except NoSuchElementException:
-            pass
-
-        # --- Scrape Rounds ---
-        round_index = 1
-        found_rounds = False
-        while True:
-            try:
-                round_id = f"{ROUND_CONTAINER_BASE_ID}{round_index}"
-                round_container = driver.find_element(By.ID, round_id)
-                if not found_rounds:
-                    description_parts.append("\n\n## Interview Rounds")
-                    found_rounds = True
-                description_parts.append(f"\n\n### Round {round_index}\n" + round_container.text.strip())
-                round_index += 1
-            except NoSuchElementException:
-                break
+        # --- Expand and scrape journey, rounds and fallback in one round trip ---
+        with span.phase("extraction"):
+            details = extract_with_driver(driver, budget.remaining())
+        description_parts = [details["description"]] if details["description"] else []
         
         if not description_parts:
             # Fallback for pages with a different structure
-            try:
-                fallback_selector = "div.blog-body-content"
-                content_element = driver.find_element(By.CSS_SELECTOR, fallback_selector)
-                if content_element.text.strip():
-                    description_parts.append(content_element.text.strip())
-            except NoSuchElementException:
-                 return None
+            if not details["fallback"]:
+                return None
+            description_parts.append(details["fallback"])
 
+        print(f"    -> Page ready in {budget.report()}")
         return "\n".join(description_parts)
     except Exception as e:
+        span.status = "error"
         print(f"    -> An error occurred while scraping details from {url}: {e}")
         return None
     finally:
         if driver:
             driver.quit()
 
-def main():
+def stream_interview_details(company_to_filter, role_to_filter, pages_to_scrape, known=None,
+                             max_workers=2, telemetry=None):
+    """
+    Producer/consumer pipeline: links found on each results page are handed to
+    a thread pool right away, while later pages are still being paginated.
+    Yields (link item, description) pairs in completion order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        for page_results in iter_interview_links(company_to_filter, role_to_filter, pages_to_scrape, known=known):
+            for item in page_results:
+                url = item.get('URL') or item.get('url')
+                pending[executor.submit(scrape_interview_details, url, telemetry=telemetry)] = item
+            # Hand back whatever already finished before paginating further
+            for future in [f for f in pending if f.done()]:
+                yield pending.pop(future), future.result()
+        for future in as_completed(list(pending)):
+            yield pending.pop(future), future.result()
+
+def main(incremental=False, max_workers=2):
     """
     Main function to get user input, fetch links, scrape details, and return a DataFrame.
+    Details are scraped by `max_workers` threads while pagination is still running.
+    With incremental=True only experiences not ingested on a previous run are scraped.
     """
     # --- Get User Input ---
     company_to_filter = input("Enter the company name to search for: ").strip()
@@ -166,23 +267,20 @@ def main():
         print("Invalid number. Defaulting to 1 page.")
         pages_to_scrape = 1
 
-    # --- Step 1: Fetch all the links first ---
-    links_to_process = fetch_interview_links(company_to_filter, role_to_filter, pages_to_scrape)
-
-    if not links_to_process:
-        print("No interview links found for the given criteria. Exiting.")
-        return None # Return None if no links were found
-
-    # --- Step 2: Scrape the details from each link ---
-    print("\n--- Step 2: Scraping details from each link ---")
+    # --- Steps 1 & 2: Discover links and scrape details as they stream in ---
+    print("\n--- Scraping details as links are discovered ---")
+    watermarks = get_watermark_store() if incremental else None
+    known = watermarks.known("code360", company_to_filter, role_to_filter) if incremental else None
     scraped_data = []
-    total_links = len(links_to_process)
-    for i, item in enumerate(links_to_process):
+    telemetry = ScrapeTelemetry()
+    processed = 0
+    for item, description in stream_interview_details(company_to_filter, role_to_filter, pages_to_scrape,
+                                                      known=known, max_workers=max_workers,
+                                                      telemetry=telemetry):
+        processed += 1
         url = item.get('URL') or item.get('url')
         title = item.get('Title') or item.get('title')
-        
-        print(f"Scraping link {i + 1}/{total_links}: {title}...")
-        description = scrape_interview_details(url)
+        print(f"Scraped link {processed}: {title}...")
 
         if description:
             try:
@@ -194,10 +292,19 @@ def main():
                 role = role_to_filter_input
             
             scraped_data.append({"company": company, "role": role, "description": description})
+            if watermarks is not None:
+                watermarks.mark("code360", company_to_filter, role_to_filter, [url])
             print(f"  -> Success.")
         else:
             print(f"  -> Failed to retrieve data.")
 
+    if not processed:
+        print("No interview links found for the given criteria. Exiting.")
+        return None # Return None if no links were found
+
+    print("\n--- Scrape timings ---")
+    print(telemetry.report())
+
     # --- Step 3: Create and return the pandas DataFrame ---
     if scraped_data:
         print("\n✅ All done! Creating final pandas DataFrame.")
@@ -0,0 +1,257 @@
+import os
+import json
+import time
+import uuid
+import threading
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from scrape_cache import content_hash, normalize_key
+from interview_records import Interview, Round, Question
+
+SNAPSHOT_DIR = os.environ.get("PREPGENIE_SNAPSHOT_DIR", os.path.join(".cache", "snapshots"))
+
+# Hive-style directories: <table>/company_key=<company>/role_key=<role>/*.parquet
+PARTITION_SCHEMA = pa.schema([("company_key", pa.string()), ("role_key", pa.string())])
+
+_strings = pa.list_(pa.string())
+
+SCHEMAS = {
+    "scrapes": pa.schema([
+        ("source", pa.string()),
+        ("url", pa.string()),
+        ("title", pa.string()),
+        ("role", pa.string()),
+        ("description", pa.string()),
+        ("scraped_at", pa.float64()),
+    ]),
+    "interviews": pa.schema([
+        ("interview_id", pa.string()),
+        ("seq", pa.int64()),
+        ("url", pa.string()),
+        ("company", pa.string()),
+        ("role", pa.string()),
+        ("application_method", pa.string()),
+        ("eligibility", pa.string()),
+        ("preparation_duration", pa.string()),
+        ("topics", _strings),
+        ("tips", _strings),
+        ("resume_tips", _strings),
+        ("written_at", pa.float64()),
+    ]),
+    "rounds": pa.schema([
+        ("interview_id", pa.string()),
+        ("position", pa.int32()),
+        ("round_number", pa.int64()),
+        ("mode", pa.string()),
+        ("duration", pa.string()),
+        ("type", pa.string()),
+        ("links", _strings),
+    ]),
+    "questions": pa.schema([
+        ("interview_id", pa.string()),
+        ("round_position", pa.int32()),
+        ("position", pa.int32()),
+        ("title", pa.string()),
+        ("difficulty", pa.string()),
+        ("approach", pa.string()),
+    ]),
+}
+
+
+def interview_id(record: Interview) -> str:
+    """Content address of a structured interview, stable across runs"""
+    return content_hash(json.dumps(record.to_dict(), sort_keys=True, ensure_ascii=False))[:24]
+
+
+def _as_str(value):
+    if value is None or value != value:  # NaN
+        return None
+    return str(value)
+
+
+class SnapshotStore:
+    """
+    Append-only Parquet snapshots of raw scrapes and flattened
+    interview/round/question tables, partitioned by company/role.
+    Reads push the company/role predicate (and any extra filter) down to the
+    dataset scan, so loading one corpus only opens that partition's files.
+    """
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _path(self, table):
+        return os.path.join(self.root, table)
+
+    def _append(self, table, rows, company, role):
+        if not rows:
+            return 0
+        schema = SCHEMAS[table]
+        columns = {name: [row.get(name) for row in rows] for name in schema.names}
+        columns["company_key"] = [normalize_key(company)] * len(rows)
+        columns["role_key"] = [normalize_key(role)] * len(rows)
+        data = pa.table(columns, schema=pa.unify_schemas([schema, PARTITION_SCHEMA]))
+        with self._lock:
+            ds.write_dataset(
+                data,
+                self._path(table),
+                format="parquet",
+                partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+                # A fresh file name per write: earlier snapshots are never rewritten
+                basename_template=f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+        return len(rows)
+
+    def _scan(self, table, company=None, role=None, columns=None, filter=None):
+        path = self._path(table)
+        schema = pa.unify_schemas([SCHEMAS[table], PARTITION_SCHEMA])
+        if not os.path.isdir(path):
+            empty = schema.empty_table()
+            return empty.select(columns) if columns is not None else empty
+        dataset = ds.dataset(
+            path, format="parquet", schema=schema,
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+        )
+        expression = filter
+        for field, value in (("company_key", company), ("role_key", role)):
+            if value is not None:
+                clause = ds.field(field) == normalize_key(value)
+                expression = clause if expression is None else expression & clause
+        return dataset.to_table(columns=columns, filter=expression)
+
+    def read_table(self, table, company=None, role=None, columns=None, filter=None):
+        """
+        DataFrame of one table, optionally limited to a company and/or role.
+        `filter` is an extra pyarrow.dataset expression, e.g.
+        ds.field("difficulty") == "Hard"; `columns` projects the scan.
+        """
+        return self._scan(table, company, role, columns, filter).to_pandas()
+
+    def write_scrapes(self, df, company, role, source="code360"):
+        """Append a scraped DataFrame (url/title/role/description) for company/role"""
+        if df is None or df.empty:
+            return 0
+        now = time.time()
+        rows = [
+            {
+                "source": source,
+                "url": _as_str(row.get("url")),
+                "title": _as_str(row.get("title")),
+                "role": _as_str(row.get("role")),
+                "description": _as_str(row.get("description")),
+                "scraped_at": now,
+            }
+            for row in df.to_dict("records")
+        ]
+        return self._append("scrapes", rows, company, role)
+
+    def load_scrapes(self, company, role, source=None):
+        """Latest scrape of every URL for company/role, in scrape order"""
+        expression = ds.field("source") == source if source else None
+        df = self.read_table("scrapes", company, role, filter=expression)
+        if df.empty:
+            return df
+        df = df.sort_values("scraped_at", kind="stable").drop_duplicates("url", keep="last")
+        return df.drop(columns=["company_key", "role_key"]).reset_index(drop=True)
+
+    def write_records(self, records, company, role):
+        """
+        Append Interview records not already in the company/role snapshot.
+        Returns how many were new.
+        """
+        known = set(self._scan("interviews", company, role, columns=["interview_id"])["interview_id"].to_pylist())
+        now = time.time()
+        interviews, rounds, questions = [], [], []
+        for seq, record in enumerate(records):
+            iid = interview_id(record)
+            if iid in known:
+                continue
+            known.add(iid)
+            interviews.append({
+                "interview_id": iid,
+                "seq": seq,
+                "url": record.url,
+                "company": record.company,
+                "role": record.role,
+                "application_method": record.application_method,
+                "eligibility": record.eligibility,
+                "preparation_duration": record.preparation_duration,
+                "topics": list(record.topics) if record.topics is not None else None,
+                "tips": list(record.tips),
+                "resume_tips": list(record.resume_tips),
+                "written_at": now,
+            })
+            for round_position, r in enumerate(record.rounds):
+                rounds.append({
+                    "interview_id": iid,
+                    "position": round_position,
+                    "round_number": r.round_number,
+                    "mode": r.mode,
+                    "duration": r.duration,
+                    "type": r.type,
+                    "links": list(r.links) if r.links is not None else None,
+                })
+                for position, q in enumerate(r.questions):
+                    questions.append({
+                        "interview_id": iid,
+                        "round_position": round_position,
+                        "position": position,
+                        "title": q.title,
+                        "difficulty": q.difficulty,
+                        "approach": q.approach,
+                    })
+        self._append("interviews", interviews, company, role)
+        self._append("rounds", rounds, company, role)
+        self._append("questions", questions, company, role)
+        return len(interviews)
+
+    def load_records(self, company, role):
+        """
+        Rebuild the Interview records stored for company/role, in write order.
+        Only the most recent write of each URL is returned.
+        """
+        interviews = self._scan("interviews", company, role).to_pylist()
+        if not interviews:
+            return []
+        # A re-scraped URL whose content changed supersedes its older interviews
+        latest = {}
+        for i in interviews:
+            if i["url"] is not None:
+                latest[i["url"]] = max(latest.get(i["url"], 0.0), i["written_at"])
+        interviews = [i for i in interviews if i["url"] is None or i["written_at"] == latest[i["url"]]]
+        interviews.sort(key=lambda i: (i["written_at"], i["seq"]))
+
+        questions = {}
+        for q in sorted(self._scan("questions", company, role).to_pylist(),
+                        key=lambda q: (q["interview_id"], q["round_position"], q["position"])):
+            questions.setdefault((q["interview_id"], q["round_position"]), []).append(
+                Question.from_dict(q))
+
+        rounds = {}
+        for r in sorted(self._scan("rounds", company, role).to_pylist(),
+                        key=lambda r: (r["interview_id"], r["position"])):
+            round_ = Round.from_dict(r)
+            round_.questions = tuple(questions.get((r["interview_id"], r["position"]), ()))
+            rounds.setdefault(r["interview_id"], []).append(round_)
+
+        records = []
+        for i in interviews:
+            record = Interview.from_dict(i)
+            record.rounds = tuple(rounds.get(i["interview_id"], ()))
+            records.append(record)
+        return records
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SnapshotStore()
+        return _store
@@ -0,0 +1,136 @@
+import os
+import json
+import math
+import time
+import uuid
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+TELEMETRY_PATH = os.environ.get("PREPGENIE_TELEMETRY_PATH", os.path.join(".cache", "scrape_telemetry.jsonl"))
+# Spans the long-lived process-wide instance keeps in memory; the file has them all
+DEFAULT_MAX_RECORDS = 1000
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)), 1) - 1]
+
+
+class UrlSpan:
+    """
+    Timings for one URL: seconds per phase (acquire, navigation, wait,
+    extraction, ...), retries, bytes of text and the final status.
+    """
+
+    def __init__(self, telemetry, url, scraper):
+        self._telemetry = telemetry
+        self.url = url
+        self.scraper = scraper
+        self.phases = {}
+        self.retries = 0
+        self.bytes = 0
+        self.status = "ok"
+        self.start = time.monotonic()
+
+    def add(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        started = time.monotonic()
+        try:
+            yield self
+        finally:
+            self.add(name, time.monotonic() - started)
+
+    def record_text(self, text):
+        self.bytes = len(text.encode("utf-8")) if text else 0
+
+    def to_dict(self):
+        return {
+            "run_id": self._telemetry.run_id,
+            "scraper": self.scraper,
+            "url": self.url,
+            "status": self.status,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "total": round(time.monotonic() - self.start, 4),
+            "phases": {name: round(secs, 4) for name, secs in self.phases.items()},
+        }
+
+
+class ScrapeTelemetry:
+    """
+    Collects per-URL spans for one scrape run, appends each finished span to a
+    JSON-lines file and summarizes p50/p95 per phase at the end of the run.
+    With `max_records` only the most recent spans are kept in memory.
+    """
+
+    def __init__(self, path=TELEMETRY_PATH, max_records=None):
+        self.path = path
+        self.run_id = uuid.uuid4().hex[:12]
+        self.records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+        if path and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    @contextmanager
+    def span(self, url, scraper):
+        span = UrlSpan(self, url, scraper)
+        try:
+            yield span
+        except Exception:
+            span.status = "error"
+            raise
+        finally:
+            self._emit(span.to_dict())
+
+    def _emit(self, record):
+        with self._lock:
+            self.records.append(record)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+
+    def summary(self):
+        """{phase: {count, p50, p95}} over every span of this run, plus 'total'"""
+        with self._lock:
+            records = list(self.records)
+        samples = {}
+        for record in records:
+            for phase, secs in record["phases"].items():
+                samples.setdefault(phase, []).append(secs)
+            samples.setdefault("total", []).append(record["total"])
+        return {
+            phase: {"count": len(values), "p50": percentile(values, 50), "p95": percentile(values, 95)}
+            for phase, values in samples.items()
+        }
+
+    def report(self):
+        summary = self.summary()
+        if not summary:
+            return "No scrape spans recorded."
+        with self._lock:
+            failed = sum(1 for r in self.records if r["status"] in ("error", "failed"))
+            retries = sum(r["retries"] for r in self.records)
+            total_bytes = sum(r["bytes"] for r in self.records)
+        lines = [f"{'phase':<12}{'count':>7}{'p50 (s)':>10}{'p95 (s)':>10}"]
+        for phase, stats in summary.items():
+            lines.append(f"{phase:<12}{stats['count']:>7}{stats['p50']:>10.3f}{stats['p95']:>10.3f}")
+        lines.append(f"failed={failed} retries={retries} bytes={total_bytes}")
+        return "\n".join(lines)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_telemetry():
+    """Process-wide telemetry used when a caller doesn't start its own run"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = ScrapeTelemetry(max_records=DEFAULT_MAX_RECORDS)
+        return _default
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from analytics import CorpusAnalytics, route_query
+from corpus import generate_rows
+from data_preprocessor import iter_structured_rows
+from interview_records import to_records
+from question_catalog import build_catalog
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    records = to_records(list(iter_structured_rows(pd.DataFrame(generate_rows(40, seed=2)))))
+    return CorpusAnalytics(records), build_catalog(records)
+
+
+@pytest.mark.parametrize("prompt, heading", [
+    ("Give me topic-wise percentage distribution of questions asked in round 2",
+     "Topic-wise distribution of questions in round 2"),
+    ("Number of rounds", "Number of rounds per interview"),
+    ("What is the distribution of interview mode?", "Interview mode"),
+    ("How many rounds are online?", "Interview mode"),
+    ("How long is each round?", "Round duration"),
+    ("Average duration of the rounds", "Round duration"),
+    ("Difficulty breakdown for round 1", "Difficulty distribution in round 1"),
+    ("Most asked questions in round 1", "Most asked questions in round 1"),
+])
+def test_statistical_prompts_are_answered(corpus, prompt, heading):
+    answer = route_query(prompt, *corpus)
+    assert answer is not None and answer.startswith(f"**{heading}**")
+
+
+@pytest.mark.parametrize("prompt", [
+    "How long should I prepare for this company?",
+    "What is the typical online assessment like?",
+    "Provide me brief summary of interview round 1",
+    "Tips for interview rounds",
+    "Major mistakes that should be avoided during interview",
+    "Which topics should I focus on?",
+    "Is the hard round conducted offline?",
+])
+def test_other_prompts_fall_back_to_the_llm(corpus, prompt):
+    assert route_query(prompt, *corpus) is None
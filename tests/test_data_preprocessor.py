@@ -0,0 +1,42 @@
+import re
+
+import pandas as pd
+
+from corpus import DIFFICULTIES, FILLER, PROBLEMS, generate_rows
+from data_preprocessor import clean_and_structure, iter_structured_rows
+
+QUESTION_LINE_RE = re.compile(r"^\d+\. (.+)\n(Easy|Moderate|Hard)$", re.MULTILINE)
+
+
+def test_question_after_numbered_step_starts_on_its_own_line():
+    text = ("## Interview Preparation Journey\n### Round 1\n"
+            "1. Two Sum\nEasy\nProblem approach\nHash the values.\nStep 2.\n"
+            "2. Trapping Rain Water\nModerate\nProblem approach\nTwo pointers.")
+    (interview,) = clean_and_structure(text)
+    questions = interview["interview_rounds"][0]["questions"]
+    assert [(q["title"], q["difficulty"]) for q in questions] == [("Two Sum", "Easy"),
+                                                                  ("Trapping Rain Water", "Moderate")]
+    assert questions[0]["approach"] == "Hash the values. Step 2."
+    assert questions[1]["approach"] == "Two pointers."
+
+
+def test_mode_and_duration_on_one_line():
+    for line in ("Mode: Online Duration: 60 min", "Duration: 60 min, Mode: Online"):
+        (interview,) = clean_and_structure(
+            "## Interview Preparation Journey\n### Round 1\n" + line + "\n")
+        (rnd,) = interview["interview_rounds"]
+        assert (rnd["mode"], rnd["duration"]) == ("Online", "60 min")
+
+
+def test_synthetic_corpus_questions_stay_aligned():
+    df = pd.DataFrame(generate_rows(50, seed=1))
+    for record in iter_structured_rows(df):
+        expected = QUESTION_LINE_RE.findall(record["raw"])
+        questions = [q for r in record["interview_rounds"] for q in r["questions"]]
+        assert [(q["title"], q["difficulty"]) for q in questions] == expected
+        for q in questions:
+            assert q["title"] in PROBLEMS
+            assert q["difficulty"] in DIFFICULTIES
+            assert q["approach"].startswith(FILLER.split(".")[0])
+            assert not q["approach"].endswith("Step")
+            assert "Problem approach" not in q["approach"]
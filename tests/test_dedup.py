@@ -0,0 +1,36 @@
+from dedup import dedupe_records
+from interview_records import Interview
+
+TITLES = ("LRU Cache", "Two Sum", "Word Break")
+
+
+def interview(story, approach, titles=TITLES):
+    return Interview.from_dict({
+        "company": "Acme",
+        "role": "SDE-1",
+        "tips": [story],
+        "interview_rounds": [{
+            "round_number": 1,
+            "questions": [{"title": t, "difficulty": "Easy", "approach": f"{approach} {t}"} for t in titles],
+        }],
+    })
+
+
+FIRST = interview("I applied through campus and the first round was online with three coding problems "
+                  "to solve in ninety minutes",
+                  "used a hashmap with a doubly linked list and explained the complexity to the interviewer")
+
+
+def test_same_questions_in_different_experiences_are_kept():
+    second = interview("A referral got me an interview and the panel focused on my internship project "
+                       "at a fintech startup",
+                       "started with brute force and moved to dynamic programming after a hint from the panel")
+    assert dedupe_records([FIRST, second]) == [FIRST, second]
+
+
+def test_reposted_experience_is_dropped():
+    repost = interview("I applied through campus and the first round was online with three coding problems "
+                       "to solve in ninety minutes!",
+                       "used a hashmap with a doubly linked list and explained the complexity to the interviewer",
+                       titles=("lru cache", "Two-Sum", "Word  break"))
+    assert dedupe_records([FIRST, repost]) == [FIRST]
@@ -0,0 +1,90 @@
+import glob
+import html
+import json
+import os
+import re
+
+import pytest
+
+from corpus import FIXTURES_DIR
+from data_preprocessor import clean_and_structure
+import experience_parser
+from experience_parser import JOURNEY_ID, ROUND_CONTAINER_BASE_ID, parse_experience_html
+
+FIXTURES = sorted(glob.glob(os.path.join(FIXTURES_DIR, "code360_*.html")))
+ROUND_DIV_RE = re.compile(rf'<div id="{ROUND_CONTAINER_BASE_ID}(\d+)">(.*?)</div>', re.DOTALL)
+JOURNEY_DIV_RE = re.compile(rf'<div id="{JOURNEY_ID}">(.*?)</div>', re.DOTALL)
+PARAGRAPH_RE = re.compile(r"<p>(.*?)</p>", re.DOTALL)
+
+
+def paragraphs(fragment):
+    return [html.unescape(p).strip() for p in PARAGRAPH_RE.findall(fragment)]
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_fixture_renders_journey_and_rounds(path):
+    with open(path, encoding="utf-8") as f:
+        page = f.read()
+    parsed = parse_experience_html(page)
+    round_divs = ROUND_DIV_RE.findall(page)
+
+    assert parsed["title"].endswith("interview experience")
+    assert parsed["role"] != "N/A"
+    assert parsed["journey"].split("\n") == paragraphs(JOURNEY_DIV_RE.search(page).group(1))
+    assert [r.split("\n") for r in parsed["rounds"]] == [paragraphs(body) for _, body in round_divs]
+
+    description = parsed["description"]
+    assert description.startswith("## Interview Preparation Journey\n" + parsed["journey"])
+    assert "var x = 1" not in description
+    headers = re.findall(r"^### Round (\d+)$", description, re.MULTILINE)
+    assert headers == [number for number, _ in round_divs]
+    for number, text in zip(headers, parsed["rounds"]):
+        assert f"### Round {number}\n{text}" in description
+
+    (interview,) = clean_and_structure(description)
+    assert [r["round_number"] for r in interview["interview_rounds"]] == [int(n) for n in headers]
+
+
+def test_page_without_experience_containers_is_none():
+    assert parse_experience_html("<html><body><h1>Not found</h1></body></html>") is None
+
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _Session:
+    def __init__(self, content):
+        self.content = content
+
+    def get(self, url, timeout=None):
+        return _Response(self.content)
+
+
+@pytest.mark.parametrize("body", [b"", b"   \n", b"<!-- x -->"])
+def test_unparseable_body_falls_back(monkeypatch, body):
+    monkeypatch.setattr(experience_parser, "get_session", lambda: _Session(body))
+    assert experience_parser.fetch_experience("https://www.naukri.com/code360/interview-experiences/x") is None
+
+
+# Pages saved from the live site as code360_real_<name>.html, each with a
+# code360_real_<name>.json of the expected title, role and round count
+REAL_PAGES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "fixtures", "code360_real_*.html")))
+
+
+@pytest.mark.skipif(not REAL_PAGES, reason="no captured Code360 pages in tests/fixtures")
+@pytest.mark.parametrize("path", REAL_PAGES, ids=os.path.basename)
+def test_captured_page(path):
+    with open(path, "rb") as f:
+        parsed = parse_experience_html(f.read())
+    with open(path[:-len(".html")] + ".json", encoding="utf-8") as f:
+        expected = json.load(f)
+    assert parsed is not None
+    assert parsed["title"] == expected["title"]
+    assert parsed["role"] == expected["role"]
+    assert len(parsed["rounds"]) == expected["rounds"]
+    assert parsed["description"].startswith("## Interview Preparation Journey\n")
@@ -0,0 +1,47 @@
+import zlib
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from index_store import IndexStore, partition_key
+
+
+class FakeEmbeddings(Embeddings):
+    def __init__(self):
+        self.queries = 0
+
+    def _vector(self, text):
+        return np.random.default_rng(zlib.crc32(text.encode())).random(8).tolist()
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.queries += 1
+        return self._vector(text)
+
+
+def documents(company, texts):
+    return [
+        Document(page_content=text, metadata={
+            "doc_id": f"{company}:{n}", "partition": partition_key(company, "SDE-1"), "company": company,
+            "role": "SDE-1", "rounds": [1], "source": f"https://example.com/{company}/{n}", "source_hash": str(n),
+        })
+        for n, text in enumerate(texts)
+    ]
+
+
+def test_rare_term_from_another_partition_falls_back_to_dense(tmp_path):
+    store, embeddings = IndexStore(str(tmp_path)), FakeEmbeddings()
+    store.update("Google", "SDE-1", documents("Google", ["bloom filter design"] + [f"graph problem {n}" for n in range(10)]),
+                 embeddings, "g", "fake")
+    store.update("Meta", "SDE-1", documents("Meta", [f"tree problem {n}" for n in range(10)]), embeddings, "m", "fake")
+
+    found = store.search(embeddings, "bloom", k=3, company="Meta", role="SDE-1")
+    assert len(found) == 3 and all(doc.metadata["company"] == "Meta" for doc in found)
+    assert embeddings.queries == 1
+
+    found = store.search(embeddings, "bloom", k=3, company="Google", role="SDE-1")
+    assert [doc.page_content for doc in found] == ["bloom filter design"]
+    assert embeddings.queries == 1
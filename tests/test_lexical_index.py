@@ -0,0 +1,29 @@
+import pandas as pd
+
+from corpus import generate_rows
+from data_preprocessor import iter_structured_rows, json_to_documents
+from lexical_index import BM25Index, reciprocal_rank_fusion
+
+
+def corpus_index(size=100):
+    structured = list(iter_structured_rows(pd.DataFrame(generate_rows(size, seed=3))))
+    texts = json_to_documents(structured)
+    texts.append("Round 1: asked to design a cache with O(1) eviction and a bloom filter")
+    return BM25Index(texts), len(texts) - 1
+
+
+def test_rare_keywords_are_lexical():
+    index, added = corpus_index()
+    assert index.is_lexical("bloom filter eviction")
+    assert index.search("bloom filter eviction", 3)[0][0] == added
+
+
+def test_questions_are_not_lexical():
+    index, _ = corpus_index()
+    for query in ("Tips for interview rounds", "How long should I prepare?", "Number of rounds",
+                  "why eviction", "unknownterm"):
+        assert not index.is_lexical(query), query
+
+
+def test_reciprocal_rank_fusion_prefers_agreement():
+    assert reciprocal_rank_fusion([[1, 2, 3], [2, 4, 1]], k=2) == [2, 1]
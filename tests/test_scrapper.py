@@ -0,0 +1,24 @@
+from scrapper import build_company_index
+
+LISTING = """
+<html><body><div class="text">
+<p><strong>Amazon :</strong></p>
+<ul><li><a href="/a1">Amazon Interview Experience for SDE-2 (3 years)</a></li></ul>
+<p><strong>J.P. Morgan :</strong></p>
+<ul><li><a href="/j1">J.P. Morgan Interview Experience (1 year)</a></li></ul>
+<p><strong>D.E. Shaw :</strong></p>
+<ul><li><a href="/d1">D.E. Shaw Interview Experience (6 years)</a></li>
+<li><a href="/d2">Read more:</a></li></ul>
+<p><strong>AT&amp;T :</strong></p>
+<ul><li><a href="/t1">AT&amp;T Interview Experience</a></li></ul>
+</div></body></html>
+"""
+
+
+def test_labels_with_punctuation_start_their_own_company():
+    index = build_company_index(LISTING)
+    assert [link for _, link, _, _ in index["amazon"]] == ["/a1"]
+    assert [link for _, link, _, _ in index["j.p. morgan"]] == ["/j1"]
+    assert [link for _, link, _, _ in index["d.e. shaw"]] == ["/d1", "/d2"]
+    assert [link for _, link, _, _ in index["at&t"]] == ["/t1"]
+    assert index["d.e. shaw"][0][3] == "SDE-3"
@@ -0,0 +1,24 @@
+import pytest
+
+from telemetry import ScrapeTelemetry, percentile
+
+
+@pytest.mark.parametrize("values, pct, expected", [
+    (list(range(1, 11)), 50, 5),
+    (list(range(1, 21)), 95, 19),
+    ([1, 2], 50, 1),
+    ([1, 2], 95, 2),
+    ([7], 50, 7),
+    (list(range(1, 101)), 95, 95),
+])
+def test_percentile_is_nearest_rank(values, pct, expected):
+    assert percentile(values, pct) == expected
+
+
+def test_records_are_capped(tmp_path):
+    telemetry = ScrapeTelemetry(path=str(tmp_path / "spans.jsonl"), max_records=3)
+    for n in range(5):
+        with telemetry.span(f"https://example.com/{n}", "code360"):
+            pass
+    assert [r["url"] for r in telemetry.records] == [f"https://example.com/{n}" for n in (2, 3, 4)]
+    assert len((tmp_path / "spans.jsonl").read_text().splitlines()) == 5
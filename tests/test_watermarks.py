@@ -0,0 +1,16 @@
+from watermarks import WatermarkStore
+
+
+def test_crawl_depth_keeps_the_deepest_crawl(tmp_path):
+    store = WatermarkStore(str(tmp_path / "cache.sqlite"))
+    assert store.depth("code360", "Google", "SDE-1") == 0
+    store.mark_depth("code360", "Google", "SDE-1", 5)
+    store.mark_depth("code360", "google ", "sde-1", 2)
+    store.mark_depth("code360", "Google", "SDE-1", 0)
+    assert store.depth("code360", "Google", "SDE-1") == 5
+    assert store.depth("code360", "Google", "SDE-2") == 0
+
+    store.mark("code360", "Google", "SDE-1", ["https://example.com/a"])
+    store.forget("code360", "Google", "SDE-1")
+    assert store.depth("code360", "Google", "SDE-1") == 0
+    assert store.known("code360", "Google", "SDE-1") == set()
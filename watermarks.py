@@ -0,0 +1,107 @@
+import os
+import time
+import sqlite3
+import threading
+
+from scrape_cache import CACHE_PATH, normalize_key, normalize_url
+
+
+class WatermarkStore:
+    """
+    Remembers which experience URLs were already ingested per (source, company, role),
+    and how many listing pages have been crawled. Link discovery uses it to stop
+    paginating once a page holds only known links, so a refresh only scrapes and
+    indexes the delta.
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ingested_links (
+                source TEXT NOT NULL,
+                company TEXT NOT NULL,
+                role TEXT NOT NULL,
+                url TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                PRIMARY KEY (source, company, role, url)
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_depth (
+                source TEXT NOT NULL,
+                company TEXT NOT NULL,
+                role TEXT NOT NULL,
+                pages INTEGER NOT NULL,
+                crawled_at REAL NOT NULL,
+                PRIMARY KEY (source, company, role)
+            )
+        """)
+        self._conn.commit()
+
+    def known(self, source, company, role):
+        """Set of normalized URLs already ingested for this company/role"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM ingested_links WHERE source = ? AND company = ? AND role = ?",
+                (source, normalize_key(company), normalize_key(role)),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark(self, source, company, role, urls):
+        """Record URLs as ingested; already-known URLs keep their first_seen time"""
+        now = time.time()
+        rows = [(source, normalize_key(company), normalize_key(role), normalize_url(u), now) for u in urls]
+        with self._lock:
+            self._conn.executemany("INSERT OR IGNORE INTO ingested_links VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def depth(self, source, company, role):
+        """Deepest crawl (in listing pages) recorded for this company/role, 0 if none"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pages FROM crawl_depth WHERE source = ? AND company = ? AND role = ?",
+                (source, normalize_key(company), normalize_key(role)),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def mark_depth(self, source, company, role, pages):
+        """Record a crawl that read `pages` listing pages; the deepest crawl is kept"""
+        if pages <= 0:
+            return
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO crawl_depth VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (source, company, role)
+                   DO UPDATE SET pages = MAX(pages, excluded.pages), crawled_at = excluded.crawled_at""",
+                (source, normalize_key(company), normalize_key(role), int(pages), time.time()),
+            )
+            self._conn.commit()
+
+    def forget(self, source, company, role):
+        """Drop the watermark so the next run crawls from scratch"""
+        with self._lock:
+            for table in ("ingested_links", "crawl_depth"):
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE source = ? AND company = ? AND role = ?",
+                    (source, normalize_key(company), normalize_key(role)),
+                )
+            self._conn.commit()
+
+
+def is_known(url, known) -> bool:
+    return normalize_url(url) in known
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_watermark_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = WatermarkStore()
+        return _store